@@ -3,49 +3,84 @@
 Demo script to show available themes and translations
 """
 
-from themes import get_theme_names, THEMES
-from translations import TRANSLATIONS
-
-print("=" * 60)
-print("XBlackBox XDR Viewer - Theme and Translation System")
-print("=" * 60)
-print()
-
-print("Available Themes:")
-print("-" * 60)
-for theme_name in get_theme_names():
-    theme = THEMES[theme_name]
-    print(f"  • {theme.name}")
-    print(f"    Primary Color: {theme.colors['primary']}")
-    print(f"    Background: {theme.colors['background']}")
-    print(f"    Plot Colors: {len(theme.plot_colors)} colors available")
-    print()
-
-print("=" * 60)
-print("Available Languages:")
-print("-" * 60)
-lang_names = {
+import sys
+
+SEP_EQ = "=" * 60
+SEP_DASH = "-" * 60
+
+LANG_NAMES = {
     'en_US': 'English',
     'zh_CN': '中文 (Chinese)',
     'ja_JP': '日本語 (Japanese)',
     'es_ES': 'Español (Spanish)',
     'fr_FR': 'Français (French)',
 }
-for lang_code in TRANSLATIONS.keys():
-    lang_name = lang_names.get(lang_code, lang_code)
-    print(f"  • {lang_name}")
-    print(f"    Window Title: {TRANSLATIONS[lang_code]['window_title']}")
-    print(f"    Status Ready: {TRANSLATIONS[lang_code]['status_ready']}")
-    print()
-
-print("=" * 60)
-print("Features:")
-print("-" * 60)
-print("  ✓ Multiple theme support (6 themes: Dark, Light, High Contrast, Blue, Solarized Dark, Nord)")
-print("  ✓ Theme switching from menu bar")
-print("  ✓ Multi-language support (5 languages: English, Chinese, Japanese, Spanish, French)")
-print("  ✓ Language switching from menu bar")  
-print("  ✓ Auto-detect system language")
-print("  ✓ Persistent theme and language preferences")
-print("  ✓ All UI text fully translated")
-print("=" * 60)
+
+FEATURES = (
+    "Multiple theme support (6 themes: Dark, Light, High Contrast, Blue, Solarized Dark, Nord)",
+    "Theme switching from menu bar",
+    "Multi-language support (5 languages: English, Chinese, Japanese, Spanish, French)",
+    "Language switching from menu bar",
+    "Auto-detect system language",
+    "Persistent theme and language preferences",
+    "All UI text fully translated",
+)
+
+
+def _themes():
+    """Import and instantiate the themes only when the themes section is built"""
+    from themes import get_theme_names, get_theme_by_name
+    return [get_theme_by_name(theme_name) for theme_name in get_theme_names()]
+
+
+def _catalogs():
+    """Import the translation catalogs only when the languages section is built"""
+    from translations import TRANSLATIONS
+    return TRANSLATIONS
+
+
+def build_demo_text() -> str:
+    """Build the demo report as a single string"""
+    # Collect all output and write it in one go instead of one write per line
+    lines = []
+
+    lines.append(SEP_EQ)
+    lines.append("XBlackBox XDR Viewer - Theme and Translation System")
+    lines.append(SEP_EQ)
+    lines.append("")
+
+    lines.append("Available Themes:")
+    lines.append(SEP_DASH)
+    for theme in _themes():
+        lines.append(f"  • {theme.name}")
+        lines.append(f"    Primary Color: {theme.colors['primary']}")
+        lines.append(f"    Background: {theme.colors['background']}")
+        lines.append(f"    Plot Colors: {theme.plot_color_count} colors available")
+        lines.append("")
+
+    lines.append(SEP_EQ)
+    lines.append("Available Languages:")
+    lines.append(SEP_DASH)
+    for lang_code, tr in _catalogs().items():
+        lines.append(f"  • {LANG_NAMES.get(lang_code, lang_code)}")
+        lines.append(f"    Window Title: {tr['window_title']}")
+        lines.append(f"    Status Ready: {tr['status_ready']}")
+        lines.append("")
+
+    lines.append(SEP_EQ)
+    lines.append("Features:")
+    lines.append(SEP_DASH)
+    lines.extend(f"  ✓ {feature}" for feature in FEATURES)
+    lines.append(SEP_EQ)
+
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    sys.stdout.write(build_demo_text())
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
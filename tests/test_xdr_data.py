@@ -0,0 +1,63 @@
+"""Tests for XDRData file reading"""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+pytest.importorskip("PySide6")
+
+from xdr_viewer import XDRData
+
+DATAREFS = [
+    ('sim/flightmodel/position/elevation', 0, 0),
+    ('sim/flightmodel/engine/ENGN_N1_', 0, 2),
+    ('sim/cockpit/switches/gear_handle_status', 1, 0),
+    ('sim/aircraft/view/acf_ICAO', 2, 0),
+]
+
+
+def _header():
+    data = b'XFDR' + struct.pack('<HBfQH', 1, 2, 0.05, 1700000000, len(DATAREFS))
+    for name, data_type, array_size in DATAREFS:
+        encoded = name.encode('utf-8')
+        data += struct.pack('<H', len(encoded)) + encoded + struct.pack('<BB', data_type, array_size)
+    return data
+
+
+def _frame(i):
+    icao = b'C172' if i % 2 else b'B738'
+    return (b'DATA' + struct.pack('<f', i * 0.05) + struct.pack('<f', 1000.0 + i)
+            + struct.pack('<2f', 50.0 + i, 51.0 + i) + struct.pack('<i', i % 2)
+            + struct.pack('<B', len(icao)) + icao)
+
+
+def _assert_same_data(a, b):
+    assert np.array_equal(a.timestamps, b.timestamps)
+    assert a.columns.keys() == b.columns.keys()
+    for key in a.columns:
+        assert np.array_equal(a.columns[key], b.columns[key])
+    assert a.string_columns == b.string_columns
+
+
+@pytest.mark.parametrize('cut', [1, 2, 3])
+def test_live_read_resumes_after_partial_frame_marker(tmp_path, cut):
+    path = tmp_path / 'live.xdr'
+    frames = b''.join(_frame(i) for i in range(100))
+    tail = b''.join(_frame(i) for i in range(100, 150))
+    path.write_bytes(_header() + frames + tail[:cut])
+    
+    data = XDRData()
+    data.read(str(path))
+    assert len(data.timestamps) == 100
+    assert not data.is_recording_complete()
+    
+    with open(path, 'ab') as f:
+        f.write(tail[cut:] + b'ENDR' + struct.pack('<IQ', 150, 1700000008))
+    assert data.read_new_frames() == 50
+    assert data.is_recording_complete()
+    
+    fresh = XDRData()
+    fresh.read(str(path))
+    _assert_same_data(data, fresh)
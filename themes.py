@@ -4,1317 +4,156 @@ Theme system for XBlackBox XDR Viewer
 Provides multiple color themes for the application
 """
 
-from typing import Dict
+import re
+import sys
+from types import MappingProxyType
+from typing import ClassVar, Dict, Mapping, NamedTuple, Optional, Tuple
 
-class Theme:
-    """Base theme class"""
-    
-    def __init__(self, name: str):
-        self.name = name
-        self.colors = {}
-        self.plot_colors = []
-        
-    def get_stylesheet(self) -> str:
-        """Get Qt stylesheet for this theme"""
-        raise NotImplementedError
-        
-    def get_plot_style(self) -> Dict:
-        """Get matplotlib plot style"""
-        raise NotImplementedError
-
-
-class DarkTheme(Theme):
-    """Dark theme (original modern theme)"""
-    
-    def __init__(self):
-        super().__init__("Dark")
-        self.colors = {
-            'primary': '#0d7377',
-            'background': '#1e1e1e',
-            'surface': '#252525',
-            'surface_alt': '#2d2d2d',
-            'border': '#3d3d3d',
-            'border_hover': '#4d4d4d',
-            'text_primary': '#e0e0e0',
-            'text_secondary': '#b0b0b0',
-            'text_disabled': '#666666',
-            'success': '#4ecdc4',
-            'warning': '#ffe66d',
-            'error': '#ff6b6b',
-        }
-        self.plot_colors = [
-            '#0d7377', '#ff6b6b', '#4ecdc4', '#ffe66d', '#a8dadc',
-            '#f06292', '#81c784', '#ffab91', '#ce93d8', '#64b5f6',
-            '#ff8a65', '#aed581', '#9fa8da', '#90caf9', '#f48fb1',
-            '#80cbc4', '#ffcc80', '#bcaaa4', '#b39ddb', '#80deea',
-        ]
-        
-    def get_stylesheet(self) -> str:
-        return f"""
-            QMainWindow {{
-                background-color: {self.colors['background']};
-            }}
-            QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 10pt;
-            }}
-            QMenuBar {{
-                background-color: {self.colors['surface_alt']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 4px;
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {self.colors['primary']};
-                color: #ffffff;
-            }}
-            QMenuBar::item:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
-            }}
-            QMenu {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 24px 6px 12px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.colors['primary']};
-                color: #ffffff;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background: {self.colors['border']};
-                margin: 4px 8px;
-            }}
-            QToolBar {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-bottom: 1px solid {self.colors['border']};
-                spacing: 6px;
-                padding: 4px;
-            }}
-            QToolButton {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            QToolButton:hover {{
-                background-color: {self.colors['border']};
-                border-color: {self.colors['border']};
-            }}
-            QToolButton:pressed {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QStatusBar {{
-                background-color: {self.colors['surface_alt']};
-                border-top: 1px solid {self.colors['border']};
-                padding: 4px;
-                color: {self.colors['text_secondary']};
-            }}
-            QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 16px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 16px;
-                top: 8px;
-                padding: 0 8px;
-                color: {self.colors['primary']};
-                font-size: 11pt;
-            }}
-            QPushButton {{
-                background-color: {self.colors['primary']};
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 16px;
-                font-weight: 500;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['primary']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
-            }}
-            QPushButton:disabled {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_disabled']};
-            }}
-            QPushButton#secondaryButton {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_primary']};
-            }}
-            QPushButton#secondaryButton:hover {{
-                background-color: {self.colors['border_hover']};
-            }}
-            QCheckBox {{
-                spacing: 8px;
-                color: {self.colors['text_primary']};
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 1px solid {self.colors['border']};
-                background-color: {self.colors['surface_alt']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
-            }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover, QComboBox:hover {{
-                border-color: {self.colors['border_hover']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            QScrollArea {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                background-color: {self.colors['surface']};
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {self.colors['border_hover']};
-                border-radius: 6px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['text_disabled']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                height: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border_hover']};
-                border-radius: 6px;
-                min-width: 30px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['text_disabled']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QTableWidget {{
-                background-color: {self.colors['surface']};
-                alternate-background-color: {self.colors['surface_alt']};
-                gridline-color: {self.colors['border']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
-                selection-color: #ffffff;
-            }}
-            QTableWidget::item {{
-                padding: 6px;
-            }}
-            QHeaderView::section {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-right: 1px solid {self.colors['border']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 8px;
-                font-weight: bold;
-                color: {self.colors['primary']};
-            }}
-            QHeaderView::section:hover {{
-                background-color: {self.colors['border']};
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                top: -1px;
-                background-color: {self.colors['surface']};
-            }}
-            QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 8px 20px;
-                margin-right: 4px;
-                font-weight: 500;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['border']};
-            }}
-            QSplitter::handle {{
-                background-color: {self.colors['border']};
-                width: 2px;
-                height: 2px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
-            }}
-            QLabel {{
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                background-color: {self.colors['surface_alt']};
-                text-align: center;
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
-                border-radius: 4px;
-            }}
-            QToolTip {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['primary']};
-                border-radius: 6px;
-                padding: 6px;
-            }}
-        """
-    
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_secondary'],
-            'ytick.color': self.colors['text_secondary'],
-            'grid.color': self.colors['border_hover'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface_alt'],
-            'legend.edgecolor': self.colors['primary'],
-        }
-
-
-class LightTheme(Theme):
-    """Light theme for better visibility in bright environments"""
-    
-    def __init__(self):
-        super().__init__("Light")
-        self.colors = {
-            'primary': '#0d7377',
-            'background': '#f5f5f5',
-            'surface': '#ffffff',
-            'surface_alt': '#e8e8e8',
-            'border': '#cccccc',
-            'border_hover': '#999999',
-            'text_primary': '#212121',
-            'text_secondary': '#616161',
-            'text_disabled': '#9e9e9e',
-            'success': '#00897b',
-            'warning': '#fbc02d',
-            'error': '#d32f2f',
-        }
-        self.plot_colors = [
-            '#0d7377', '#d32f2f', '#00897b', '#f57c00', '#5e35b1',
-            '#c2185b', '#388e3c', '#f4511e', '#7b1fa2', '#1976d2',
-            '#e64a19', '#689f38', '#512da8', '#0288d1', '#c2185b',
-            '#00796b', '#f57f17', '#5d4037', '#6a1b9a', '#0097a7',
-        ]
-        
-    def get_stylesheet(self) -> str:
-        return f"""
-            QMainWindow {{
-                background-color: {self.colors['background']};
-            }}
-            QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 10pt;
-            }}
-            QMenuBar {{
-                background-color: {self.colors['surface']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 4px;
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {self.colors['primary']};
-                color: white;
-            }}
-            QMenuBar::item:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
-            }}
-            QMenu {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 24px 6px 12px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.colors['primary']};
-                color: white;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background: {self.colors['border']};
-                margin: 4px 8px;
-            }}
-            QToolBar {{
-                background-color: {self.colors['surface']};
-                border: none;
-                border-bottom: 1px solid {self.colors['border']};
-                spacing: 6px;
-                padding: 4px;
-            }}
-            QToolButton {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            QToolButton:hover {{
-                background-color: {self.colors['surface_alt']};
-                border-color: {self.colors['border']};
-            }}
-            QToolButton:pressed {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QStatusBar {{
-                background-color: {self.colors['surface']};
-                border-top: 1px solid {self.colors['border']};
-                padding: 4px;
-                color: {self.colors['text_secondary']};
-            }}
-            QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 16px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 16px;
-                top: 8px;
-                padding: 0 8px;
-                color: {self.colors['primary']};
-                font-size: 11pt;
-            }}
-            QPushButton {{
-                background-color: {self.colors['primary']};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 16px;
-                font-weight: 500;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['primary']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
-            }}
-            QPushButton:disabled {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_disabled']};
-            }}
-            QPushButton#secondaryButton {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_primary']};
-            }}
-            QPushButton#secondaryButton:hover {{
-                background-color: {self.colors['border']};
-            }}
-            QCheckBox {{
-                spacing: 8px;
-                color: {self.colors['text_primary']};
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 1px solid {self.colors['border']};
-                background-color: {self.colors['surface']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
-            }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover, QComboBox:hover {{
-                border-color: {self.colors['border_hover']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            QScrollArea {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                background-color: {self.colors['surface']};
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {self.colors['border']};
-                border-radius: 6px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['border_hover']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                height: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border']};
-                border-radius: 6px;
-                min-width: 30px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['border_hover']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QTableWidget {{
-                background-color: {self.colors['surface']};
-                alternate-background-color: #fafafa;
-                gridline-color: {self.colors['border']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
-                selection-color: white;
-            }}
-            QTableWidget::item {{
-                padding: 6px;
-            }}
-            QHeaderView::section {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-right: 1px solid {self.colors['border']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 8px;
-                font-weight: bold;
-                color: {self.colors['primary']};
-            }}
-            QHeaderView::section:hover {{
-                background-color: {self.colors['border']};
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                top: -1px;
-                background-color: {self.colors['surface']};
-            }}
-            QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 8px 20px;
-                margin-right: 4px;
-                font-weight: 500;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['border']};
-            }}
-            QSplitter::handle {{
-                background-color: {self.colors['border']};
-                width: 2px;
-                height: 2px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
-            }}
-            QLabel {{
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                background-color: {self.colors['surface']};
-                text-align: center;
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
-                border-radius: 4px;
-            }}
-            QToolTip {{
-                background-color: {self.colors['surface']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['primary']};
-                border-radius: 6px;
-                padding: 6px;
-            }}
-        """
-    
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_secondary'],
-            'ytick.color': self.colors['text_secondary'],
-            'grid.color': self.colors['border'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface'],
-            'legend.edgecolor': self.colors['primary'],
-        }
-
-
-class HighContrastTheme(Theme):
-    """High contrast theme for accessibility"""
-    
-    def __init__(self):
-        super().__init__("High Contrast")
-        self.colors = {
-            'primary': '#00ffff',
-            'background': '#000000',
-            'surface': '#1a1a1a',
-            'surface_alt': '#2a2a2a',
-            'border': '#ffffff',
-            'border_hover': '#00ffff',
-            'text_primary': '#ffffff',
-            'text_secondary': '#e0e0e0',
-            'text_disabled': '#808080',
-            'success': '#00ff00',
-            'warning': '#ffff00',
-            'error': '#ff0000',
-        }
-        self.plot_colors = [
-            '#00ffff', '#ff00ff', '#ffff00', '#00ff00', '#ff8800',
-            '#ff0088', '#88ff00', '#0088ff', '#ff0000', '#0000ff',
-            '#ff6600', '#66ff00', '#0066ff', '#ff0066', '#6600ff',
-            '#00ff66', '#ff6600', '#880088', '#008888', '#888800',
-        ]
-        
-    def get_stylesheet(self) -> str:
-        return f"""
-            QMainWindow {{
-                background-color: {self.colors['background']};
-            }}
-            QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 11pt;
-            }}
-            QMenuBar {{
-                background-color: {self.colors['surface']};
-                border-bottom: 2px solid {self.colors['border']};
-                padding: 4px;
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 8px 14px;
-                border-radius: 4px;
-                border: 1px solid transparent;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
-                border: 1px solid {self.colors['border']};
-            }}
-            QMenu {{
-                background-color: {self.colors['surface']};
-                border: 2px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 10px 26px 10px 14px;
-                border-radius: 4px;
-                border: 1px solid transparent;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
-                border: 1px solid {self.colors['border']};
-            }}
-            QMenu::separator {{
-                height: 2px;
-                background: {self.colors['border']};
-                margin: 6px 10px;
-            }}
-            QToolBar {{
-                background-color: {self.colors['surface']};
-                border: none;
-                border-bottom: 2px solid {self.colors['border']};
-                spacing: 8px;
-                padding: 4px;
-            }}
-            QToolButton {{
-                background-color: transparent;
-                border: 2px solid transparent;
-                border-radius: 6px;
-                padding: 6px;
-            }}
-            QToolButton:hover {{
-                border-color: {self.colors['border']};
-            }}
-            QToolButton:pressed {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QStatusBar {{
-                background-color: {self.colors['surface']};
-                border-top: 2px solid {self.colors['border']};
-                padding: 6px;
-                color: {self.colors['text_primary']};
-            }}
-            QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 2px solid {self.colors['border']};
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 16px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 16px;
-                top: 8px;
-                padding: 0 8px;
-                color: {self.colors['primary']};
-                font-size: 12pt;
-            }}
-            QPushButton {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
-                border: 2px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 10px 22px;
-                font-weight: bold;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['border']};
-            }}
-            QPushButton:disabled {{
-                border-color: {self.colors['text_disabled']};
-                color: {self.colors['text_disabled']};
-            }}
-            QPushButton#secondaryButton {{
-                background-color: {self.colors['surface']};
-            }}
-            QCheckBox {{
-                spacing: 10px;
-                color: {self.colors['text_primary']};
-            }}
-            QCheckBox::indicator {{
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-                border: 2px solid {self.colors['border']};
-                background-color: {self.colors['background']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['background']};
-                border: 2px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
-                selection-color: {self.colors['background']};
-            }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
-                border-width: 3px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 28px;
-            }}
-            QScrollArea {{
-                border: 2px solid {self.colors['border']};
-                border-radius: 8px;
-                background-color: {self.colors['surface']};
-            }}
-            QScrollBar:vertical {{
-                border: 2px solid {self.colors['border']};
-                background-color: {self.colors['background']};
-                width: 18px;
-                border-radius: 8px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {self.colors['border']};
-                border-radius: 6px;
-                min-height: 40px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['primary']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                border: 2px solid {self.colors['border']};
-                background-color: {self.colors['background']};
-                height: 18px;
-                border-radius: 8px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border']};
-                border-radius: 6px;
-                min-width: 40px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['primary']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QTableWidget {{
-                background-color: {self.colors['background']};
-                alternate-background-color: {self.colors['surface']};
-                gridline-color: {self.colors['border']};
-                border: 2px solid {self.colors['border']};
-                border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
-                selection-color: {self.colors['background']};
-            }}
-            QTableWidget::item {{
-                padding: 8px;
-            }}
-            QHeaderView::section {{
-                background-color: {self.colors['surface']};
-                border: 2px solid {self.colors['border']};
-                border-right: none;
-                border-top: none;
-                padding: 10px;
-                font-weight: bold;
-                color: {self.colors['primary']};
-            }}
-            QTabWidget::pane {{
-                border: 2px solid {self.colors['border']};
-                border-radius: 8px;
-                top: -2px;
-                background-color: {self.colors['surface']};
-            }}
-            QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 2px solid {self.colors['border']};
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 12px 22px;
-                margin-right: 4px;
-                font-weight: bold;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
-            }}
-            QSplitter::handle {{
-                background-color: {self.colors['border']};
-                width: 3px;
-                height: 3px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
-            }}
-            QLabel {{
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar {{
-                border: 2px solid {self.colors['border']};
-                border-radius: 6px;
-                background-color: {self.colors['background']};
-                text-align: center;
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
-                border-radius: 4px;
-            }}
-            QToolTip {{
-                background-color: {self.colors['surface']};
-                color: {self.colors['text_primary']};
-                border: 2px solid {self.colors['primary']};
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 11pt;
-            }}
-        """
-    
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_primary'],
-            'ytick.color': self.colors['text_primary'],
-            'grid.color': self.colors['border'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface'],
-            'legend.edgecolor': self.colors['primary'],
-        }
-
-
-class BlueTheme(Theme):
-    """Blue theme with calming blue tones"""
-    
-    def __init__(self):
-        super().__init__("Blue")
-        self.colors = {
-            'primary': '#2196f3',
-            'background': '#0d1117',
-            'surface': '#161b22',
-            'surface_alt': '#21262d',
-            'border': '#30363d',
-            'border_hover': '#484f58',
-            'text_primary': '#c9d1d9',
-            'text_secondary': '#8b949e',
-            'text_disabled': '#6e7681',
-            'success': '#3fb950',
-            'warning': '#d29922',
-            'error': '#f85149',
-        }
-        self.plot_colors = [
-            '#2196f3', '#f44336', '#4caf50', '#ff9800', '#9c27b0',
-            '#00bcd4', '#ffeb3b', '#e91e63', '#8bc34a', '#673ab7',
-            '#03a9f4', '#ff5722', '#cddc39', '#009688', '#ffc107',
-            '#3f51b5', '#795548', '#607d8b', '#ff6f00', '#00e676',
-        ]
-        
-    def get_stylesheet(self) -> str:
-        return f"""
-            QMainWindow {{
-                background-color: {self.colors['background']};
-            }}
-            QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 10pt;
-            }}
-            QMenuBar {{
-                background-color: {self.colors['surface_alt']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 4px;
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {self.colors['primary']};
-                color: #ffffff;
-            }}
-            QMenuBar::item:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
-            }}
-            QMenu {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 24px 6px 12px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {self.colors['primary']};
-                color: #ffffff;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background: {self.colors['border']};
-                margin: 4px 8px;
-            }}
-            QToolBar {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-bottom: 1px solid {self.colors['border']};
-                spacing: 6px;
-                padding: 4px;
-            }}
-            QToolButton {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            QToolButton:hover {{
-                background-color: {self.colors['border']};
-                border-color: {self.colors['border']};
-            }}
-            QToolButton:pressed {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QStatusBar {{
-                background-color: {self.colors['surface_alt']};
-                border-top: 1px solid {self.colors['border']};
-                padding: 4px;
-                color: {self.colors['text_secondary']};
-            }}
-            QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 16px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 16px;
-                top: 8px;
-                padding: 0 8px;
-                color: {self.colors['primary']};
-                font-size: 11pt;
-            }}
-            QPushButton {{
-                background-color: {self.colors['primary']};
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 16px;
-                font-weight: 500;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['primary']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
-            }}
-            QPushButton:disabled {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_disabled']};
-            }}
-            QPushButton#secondaryButton {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_primary']};
-            }}
-            QPushButton#secondaryButton:hover {{
-                background-color: {self.colors['border_hover']};
-            }}
-            QCheckBox {{
-                spacing: 8px;
-                color: {self.colors['text_primary']};
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 1px solid {self.colors['border']};
-                background-color: {self.colors['surface_alt']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
-            }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
-            }}
-            QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover, QComboBox:hover {{
-                border-color: {self.colors['border_hover']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            QScrollArea {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                background-color: {self.colors['surface']};
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {self.colors['border_hover']};
-                border-radius: 6px;
-                min-height: 30px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['text_disabled']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                height: 12px;
-                border-radius: 6px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border_hover']};
-                border-radius: 6px;
-                min-width: 30px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['text_disabled']};
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-            QTableWidget {{
-                background-color: {self.colors['surface']};
-                alternate-background-color: #1c2128;
-                gridline-color: {self.colors['border']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
-                selection-color: #ffffff;
-            }}
-            QTableWidget::item {{
-                padding: 6px;
-            }}
-            QHeaderView::section {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-right: 1px solid {self.colors['border']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 8px;
-                font-weight: bold;
-                color: {self.colors['primary']};
-            }}
-            QHeaderView::section:hover {{
-                background-color: {self.colors['border']};
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 8px;
-                top: -1px;
-                background-color: {self.colors['surface']};
-            }}
-            QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 8px 20px;
-                margin-right: 4px;
-                font-weight: 500;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['border']};
-            }}
-            QSplitter::handle {{
-                background-color: {self.colors['border']};
-                width: 2px;
-                height: 2px;
-            }}
-            QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
-            }}
-            QLabel {{
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar {{
-                border: 1px solid {self.colors['border']};
-                border-radius: 6px;
-                background-color: {self.colors['surface_alt']};
-                text-align: center;
-                color: {self.colors['text_primary']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
-                border-radius: 4px;
-            }}
-            QToolTip {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['primary']};
-                border-radius: 6px;
-                padding: 6px;
-            }}
-        """
+def _palette(colors: Dict[str, str]) -> MappingProxyType:
+    """Freeze a palette, interning its hex strings so repeats share one object"""
+    return MappingProxyType({key: sys.intern(color) for key, color in colors.items()})
+
+
+# Whitespace runs, and whitespace around QSS punctuation, dropped by _minify_stylesheet
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_SPACE_RE = re.compile(r"\s*([{};:,])\s*")
+
+
+def _minify_stylesheet(css: str) -> str:
+    """Collapse whitespace in a stylesheet so Qt has less text to tokenize"""
+    css = _WHITESPACE_RE.sub(" ", css)
+    return _PUNCTUATION_SPACE_RE.sub(r"\1", css).strip()
+
+
+class PlotStyle(NamedTuple):
+    """Colors applied to matplotlib figures"""
+    figure_facecolor: str
+    axes_facecolor: str
+    axes_edgecolor: str
+    axes_labelcolor: str
+    xtick_color: str
+    ytick_color: str
+    grid_color: str
+    text_color: str
+    legend_facecolor: str
+    legend_edgecolor: str
     
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_secondary'],
-            'ytick.color': self.colors['text_secondary'],
-            'grid.color': self.colors['border_hover'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface_alt'],
-            'legend.edgecolor': self.colors['primary'],
-        }
+    def as_rcparams(self) -> Dict[str, str]:
+        """Map the fields to their matplotlib rcParams keys"""
+        return {field.replace('_', '.', 1): value for field, value in zip(self._fields, self)}
 
 
-class SolarizedDarkTheme(Theme):
-    """Solarized Dark theme - popular among developers"""
+class Theme:
+    """Base theme class"""
     
+    # Qt stylesheet with {color_name} placeholders, rendered with format_map(colors).
+    # Every concrete theme must set it.
+    _STYLESHEET_TEMPLATE: ClassVar[Optional[str]] = None
+    # Template role placeholders mapped to a palette key or a literal color
+    _STYLESHEET_ROLES: ClassVar[Dict[str, str]] = {}
+    
+    # PlotStyle field mapped to the palette key providing its color
+    _PLOT_STYLE_ROLES: ClassVar[Dict[str, str]] = {
+        'figure_facecolor': 'background',
+        'axes_facecolor': 'surface',
+        'axes_edgecolor': 'border',
+        'axes_labelcolor': 'text_primary',
+        'xtick_color': 'text_secondary',
+        'ytick_color': 'text_secondary',
+        'grid_color': 'border_hover',
+        'text_color': 'text_primary',
+        'legend_facecolor': 'surface_alt',
+        'legend_edgecolor': 'primary',
+    }
+    
+    # Display name, readable from the class without creating the theme
+    name: ClassVar[str] = ''
+    
+    # Colors cycled through when plotting parameters
+    plot_colors: Tuple[str, ...] = ()
+    # Number of plot colors, counted once when each theme class is defined
+    plot_color_count: ClassVar[int] = 0
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.plot_color_count = len(cls.plot_colors)
+        
     def __init__(self):
-        super().__init__("Solarized Dark")
-        self.colors = {
-            'primary': '#268bd2',
-            'background': '#002b36',
-            'surface': '#073642',
-            'surface_alt': '#0e4050',
-            'border': '#586e75',
-            'border_hover': '#657b83',
-            'text_primary': '#839496',
-            'text_secondary': '#586e75',
-            'text_disabled': '#073642',
-            'success': '#859900',
-            'warning': '#b58900',
-            'error': '#dc322f',
-        }
-        self.plot_colors = [
-            '#268bd2', '#dc322f', '#859900', '#b58900', '#d33682',
-            '#2aa198', '#cb4b16', '#6c71c4', '#859900', '#b58900',
-            '#268bd2', '#dc322f', '#2aa198', '#d33682', '#6c71c4',
-            '#cb4b16', '#859900', '#b58900', '#dc322f', '#268bd2',
-        ]
+        if self._STYLESHEET_TEMPLATE is None:
+            raise TypeError(f"{type(self).__name__} must define _STYLESHEET_TEMPLATE")
+        self.colors = {}
+        self._cached_css: Optional[str] = None
+        self._cached_plot_style: Optional[PlotStyle] = None
+        self._cached_plot_rcparams: Optional[Mapping[str, str]] = None
+        self._cached_rc_params = None
         
     def get_stylesheet(self) -> str:
-        return f"""
+        """Get Qt stylesheet for this theme (built on first call, then cached)"""
+        if self._cached_css is None:
+            self._cached_css = _minify_stylesheet(self._build_stylesheet())
+        return self._cached_css
+        
+    def _build_stylesheet(self) -> str:
+        """Build the Qt stylesheet for this theme by rendering _STYLESHEET_TEMPLATE"""
+        return self._STYLESHEET_TEMPLATE.format_map(self._stylesheet_values())
+        
+    def _stylesheet_values(self) -> Dict[str, str]:
+        """Palette colors plus the resolved stylesheet role placeholders"""
+        values = dict(self.colors)
+        for role, color in self._STYLESHEET_ROLES.items():
+            values[role] = values.get(color, color)
+        return values
+        
+    @property
+    def plot_style(self) -> PlotStyle:
+        """Plot style for this theme (built on first access, then cached)"""
+        if self._cached_plot_style is None:
+            self._cached_plot_style = self._build_plot_style()
+        return self._cached_plot_style
+        
+    def _build_plot_style(self) -> PlotStyle:
+        """Build the plot style for this theme from its palette"""
+        return PlotStyle(**{field: self.colors[key] for field, key in self._PLOT_STYLE_ROLES.items()})
+        
+    def get_plot_style(self) -> Mapping[str, str]:
+        """Get matplotlib plot style as read-only rcParams (built on first call, then cached)"""
+        if self._cached_plot_rcparams is None:
+            # Read-only, so callers can't alter the copy every later call returns
+            self._cached_plot_rcparams = MappingProxyType(self.plot_style.as_rcparams())
+        return self._cached_plot_rcparams
+        
+    def apply_plot_style(self):
+        """Apply the plot style to matplotlib's global rcParams"""
+        import matplotlib
+        if self._cached_rc_params is None:
+            # Validated once here instead of re-validating a raw dict on every switch
+            self._cached_rc_params = matplotlib.RcParams(self.get_plot_style())
+        matplotlib.rcParams.update(self._cached_rc_params)
+        
+    def invalidate(self):
+        """Drop cached stylesheet and plot style after the colors change"""
+        self._cached_css = None
+        self._cached_plot_style = None
+        self._cached_plot_rcparams = None
+        self._cached_rc_params = None
+
+
+# Stylesheet shared by the themes that differ only in color choices. Besides
+# the palette keys it uses role placeholders (e.g. {panel_background}) that
+# each theme maps to one of its colors through _STYLESHEET_ROLES.
+_BASE_STYLESHEET_TEMPLATE = """
             QMainWindow {{
-                background-color: {self.colors['background']};
+                background-color: {background};
             }}
             QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
+                background-color: {background};
+                color: {text_primary};
                 font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
                 font-size: 10pt;
             }}
             QMenuBar {{
-                background-color: {self.colors['surface']};
-                border-bottom: 1px solid {self.colors['border']};
+                background-color: {panel_background};
+                border-bottom: 1px solid {border};
                 padding: 4px;
             }}
             QMenuBar::item {{
@@ -1323,16 +162,16 @@ class SolarizedDarkTheme(Theme):
                 border-radius: 4px;
             }}
             QMenuBar::item:selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
+                background-color: {primary};
+                color: {on_primary};
             }}
             QMenuBar::item:pressed {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 opacity: 0.8;
             }}
             QMenu {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
+                background-color: {panel_background};
+                border: 1px solid {border};
                 border-radius: 6px;
                 padding: 4px;
             }}
@@ -1341,18 +180,18 @@ class SolarizedDarkTheme(Theme):
                 border-radius: 4px;
             }}
             QMenu::item:selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
+                background-color: {primary};
+                color: {on_primary};
             }}
             QMenu::separator {{
                 height: 1px;
-                background: {self.colors['border']};
+                background: {border};
                 margin: 4px 8px;
             }}
             QToolBar {{
-                background-color: {self.colors['surface']};
+                background-color: {panel_background};
                 border: none;
-                border-bottom: 1px solid {self.colors['border']};
+                border-bottom: 1px solid {border};
                 spacing: 6px;
                 padding: 4px;
             }}
@@ -1363,22 +202,22 @@ class SolarizedDarkTheme(Theme):
                 padding: 4px;
             }}
             QToolButton:hover {{
-                background-color: {self.colors['surface_alt']};
-                border-color: {self.colors['border']};
+                background-color: {hover_background};
+                border-color: {border};
             }}
             QToolButton:pressed {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
+                background-color: {primary};
+                border-color: {primary};
             }}
             QStatusBar {{
-                background-color: {self.colors['surface']};
-                border-top: 1px solid {self.colors['border']};
+                background-color: {panel_background};
+                border-top: 1px solid {border};
                 padding: 4px;
-                color: {self.colors['text_secondary']};
+                color: {text_secondary};
             }}
             QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border: 1px solid {border};
                 border-radius: 8px;
                 margin-top: 16px;
                 padding-top: 16px;
@@ -1390,12 +229,12 @@ class SolarizedDarkTheme(Theme):
                 left: 16px;
                 top: 8px;
                 padding: 0 8px;
-                color: {self.colors['primary']};
+                color: {primary};
                 font-size: 11pt;
             }}
             QPushButton {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
+                background-color: {primary};
+                color: {on_primary};
                 border: none;
                 border-radius: 6px;
                 padding: 6px 16px;
@@ -1403,131 +242,132 @@ class SolarizedDarkTheme(Theme):
                 min-width: 80px;
             }}
             QPushButton:hover {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 border: 1px solid rgba(255, 255, 255, 0.2);
             }}
             QPushButton:pressed {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 opacity: 0.8;
             }}
             QPushButton:disabled {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_disabled']};
+                background-color: {button_disabled};
+                color: {text_disabled};
             }}
             QPushButton#secondaryButton {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_primary']};
+                background-color: {secondary_button};
+                color: {text_primary};
             }}
             QPushButton#secondaryButton:hover {{
-                background-color: {self.colors['border']};
+                background-color: {secondary_button_hover};
             }}
             QCheckBox {{
                 spacing: 8px;
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QCheckBox::indicator {{
                 width: 18px;
                 height: 18px;
                 border-radius: 4px;
-                border: 1px solid {self.colors['border']};
-                background-color: {self.colors['surface']};
+                border: 1px solid {border};
+                background-color: {panel_background};
             }}
             QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
+                background-color: {primary};
+                border-color: {primary};
             }}
             QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
+                border-color: {primary};
             }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
+            QLineEdit, QAbstractSpinBox, QComboBox {{
+                background-color: {panel_background};
+                border: 1px solid {border};
                 border-radius: 6px;
                 padding: 6px 10px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
+                color: {text_primary};
+                selection-background-color: {primary};
             }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
+            QLineEdit:focus, QAbstractSpinBox:focus, QComboBox:focus {{
+                border-color: {primary};
             }}
-            QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover, QComboBox:hover {{
-                border-color: {self.colors['border_hover']};
+            QLineEdit:hover, QAbstractSpinBox:hover, QComboBox:hover {{
+                border-color: {border_hover};
             }}
             QComboBox::drop-down {{
                 border: none;
                 width: 24px;
             }}
             QScrollArea {{
-                border: 1px solid {self.colors['border']};
+                border: 1px solid {border};
                 border-radius: 8px;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
             }}
             QScrollBar:vertical {{
                 border: none;
-                background-color: {self.colors['surface']};
+                background-color: {scrollbar_track};
                 width: 12px;
                 border-radius: 6px;
             }}
             QScrollBar::handle:vertical {{
-                background-color: {self.colors['border']};
+                background-color: {scrollbar_handle};
                 border-radius: 6px;
                 min-height: 30px;
             }}
             QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['border_hover']};
+                background-color: {scrollbar_handle_hover};
             }}
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
             QScrollBar:horizontal {{
                 border: none;
-                background-color: {self.colors['surface']};
+                background-color: {scrollbar_track};
                 height: 12px;
                 border-radius: 6px;
             }}
             QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border']};
+                background-color: {scrollbar_handle};
                 border-radius: 6px;
                 min-width: 30px;
             }}
             QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['border_hover']};
+                background-color: {scrollbar_handle_hover};
             }}
             QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
                 width: 0px;
             }}
             QTableWidget {{
-                background-color: {self.colors['surface']};
-                alternate-background-color: {self.colors['surface_alt']};
-                gridline-color: {self.colors['border']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                alternate-background-color: {alternate_row};
+                gridline-color: {border};
+                border: 1px solid {border};
                 border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
+                selection-background-color: {primary};
+                selection-color: {selection_text};
             }}
             QTableWidget::item {{
                 padding: 6px;
             }}
             QHeaderView::section {{
-                background-color: {self.colors['surface_alt']};
+                background-color: {surface_alt};
                 border: none;
-                border-right: 1px solid {self.colors['border']};
-                border-bottom: 1px solid {self.colors['border']};
+                border-right: 1px solid {border};
+                border-bottom: 1px solid {border};
                 padding: 8px;
                 font-weight: bold;
-                color: {self.colors['primary']};
+                color: {primary};
             }}
             QHeaderView::section:hover {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QTabWidget::pane {{
-                border: 1px solid {self.colors['border']};
+                border: 1px solid {border};
                 border-radius: 8px;
                 top: -1px;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
             }}
             QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface_alt};
+                border: 1px solid {border};
                 border-bottom: none;
                 border-top-left-radius: 8px;
                 border-top-right-radius: 8px;
@@ -1536,163 +376,254 @@ class SolarizedDarkTheme(Theme):
                 font-weight: 500;
             }}
             QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
+                background-color: {surface};
+                border-bottom-color: {surface};
+                color: {primary};
             }}
             QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QSplitter::handle {{
-                background-color: {self.colors['border']};
+                background-color: {border};
                 width: 2px;
                 height: 2px;
             }}
             QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
             }}
             QLabel {{
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QProgressBar {{
-                border: 1px solid {self.colors['border']};
+                border: 1px solid {border};
                 border-radius: 6px;
-                background-color: {self.colors['surface']};
+                background-color: {panel_background};
                 text-align: center;
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 border-radius: 4px;
             }}
             QToolTip {{
-                background-color: {self.colors['surface']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['primary']};
+                background-color: {panel_background};
+                color: {text_primary};
+                border: 1px solid {primary};
                 border-radius: 6px;
                 padding: 6px;
             }}
         """
+
+
+# Read-only palette shared by every DarkTheme instance
+_DARK_COLORS = _palette({
+    'primary': '#0d7377',
+    'background': '#1e1e1e',
+    'surface': '#252525',
+    'surface_alt': '#2d2d2d',
+    'border': '#3d3d3d',
+    'border_hover': '#4d4d4d',
+    'text_primary': '#e0e0e0',
+    'text_secondary': '#b0b0b0',
+    'text_disabled': '#666666',
+    'success': '#4ecdc4',
+    'warning': '#ffe66d',
+    'error': '#ff6b6b',
+})
+
+
+class DarkTheme(Theme):
+    """Dark theme (original modern theme)"""
+    
+    name = "Dark"
+    
+    _STYLESHEET_TEMPLATE = _BASE_STYLESHEET_TEMPLATE
+    _STYLESHEET_ROLES = {
+        'panel_background': 'surface_alt',
+        'on_primary': '#ffffff',
+        'hover_background': 'border',
+        'button_disabled': 'border',
+        'secondary_button': 'border',
+        'secondary_button_hover': 'border_hover',
+        'scrollbar_track': 'surface_alt',
+        'scrollbar_handle': 'border_hover',
+        'scrollbar_handle_hover': 'text_disabled',
+        'alternate_row': 'surface_alt',
+        'selection_text': '#ffffff',
+    }
+    
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#0d7377', '#ff6b6b', '#4ecdc4', '#ffe66d', '#a8dadc',
+        '#f06292', '#81c784', '#ffab91', '#ce93d8', '#64b5f6',
+        '#ff8a65', '#aed581', '#9fa8da', '#90caf9', '#f48fb1',
+        '#80cbc4', '#ffcc80', '#bcaaa4', '#b39ddb', '#80deea',
+    ))
     
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_secondary'],
-            'ytick.color': self.colors['text_secondary'],
-            'grid.color': self.colors['border'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface'],
-            'legend.edgecolor': self.colors['primary'],
-        }
+    def __init__(self):
+        super().__init__()
+        self.colors = _DARK_COLORS
 
 
-class NordTheme(Theme):
-    """Nord theme - arctic, north-bluish color palette"""
+# Read-only palette shared by every LightTheme instance
+_LIGHT_COLORS = _palette({
+    'primary': '#0d7377',
+    'background': '#f5f5f5',
+    'surface': '#ffffff',
+    'surface_alt': '#e8e8e8',
+    'border': '#cccccc',
+    'border_hover': '#999999',
+    'text_primary': '#212121',
+    'text_secondary': '#616161',
+    'text_disabled': '#9e9e9e',
+    'success': '#00897b',
+    'warning': '#fbc02d',
+    'error': '#d32f2f',
+})
+
+
+class LightTheme(Theme):
+    """Light theme for better visibility in bright environments"""
+    
+    name = "Light"
+    
+    _STYLESHEET_TEMPLATE = _BASE_STYLESHEET_TEMPLATE
+    _STYLESHEET_ROLES = {
+        'panel_background': 'surface',
+        'on_primary': 'white',
+        'hover_background': 'surface_alt',
+        'button_disabled': 'border',
+        'secondary_button': 'surface_alt',
+        'secondary_button_hover': 'border',
+        'scrollbar_track': 'surface_alt',
+        'scrollbar_handle': 'border',
+        'scrollbar_handle_hover': 'border_hover',
+        'alternate_row': '#fafafa',
+        'selection_text': 'white',
+    }
+    
+    _PLOT_STYLE_ROLES = {
+        'figure_facecolor': 'background',
+        'axes_facecolor': 'surface',
+        'axes_edgecolor': 'border',
+        'axes_labelcolor': 'text_primary',
+        'xtick_color': 'text_secondary',
+        'ytick_color': 'text_secondary',
+        'grid_color': 'border',
+        'text_color': 'text_primary',
+        'legend_facecolor': 'surface',
+        'legend_edgecolor': 'primary',
+    }
+    
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#0d7377', '#d32f2f', '#00897b', '#f57c00', '#5e35b1',
+        '#c2185b', '#388e3c', '#f4511e', '#7b1fa2', '#1976d2',
+        '#e64a19', '#689f38', '#512da8', '#0288d1', '#c2185b',
+        '#00796b', '#f57f17', '#5d4037', '#6a1b9a', '#0097a7',
+    ))
     
     def __init__(self):
-        super().__init__("Nord")
-        self.colors = {
-            'primary': '#88c0d0',
-            'background': '#2e3440',
-            'surface': '#3b4252',
-            'surface_alt': '#434c5e',
-            'border': '#4c566a',
-            'border_hover': '#5e6d8a',
-            'text_primary': '#eceff4',
-            'text_secondary': '#d8dee9',
-            'text_disabled': '#4c566a',
-            'success': '#a3be8c',
-            'warning': '#ebcb8b',
-            'error': '#bf616a',
-        }
-        self.plot_colors = [
-            '#88c0d0', '#bf616a', '#a3be8c', '#ebcb8b', '#b48ead',
-            '#5e81ac', '#d08770', '#8fbcbb', '#81a1c1', '#a3be8c',
-            '#88c0d0', '#bf616a', '#b48ead', '#d08770', '#ebcb8b',
-            '#5e81ac', '#8fbcbb', '#81a1c1', '#a3be8c', '#88c0d0',
-        ]
-        
-    def get_stylesheet(self) -> str:
-        return f"""
+        super().__init__()
+        self.colors = _LIGHT_COLORS
+
+
+# Read-only palette shared by every HighContrastTheme instance
+_HIGH_CONTRAST_COLORS = _palette({
+    'primary': '#00ffff',
+    'background': '#000000',
+    'surface': '#1a1a1a',
+    'surface_alt': '#2a2a2a',
+    'border': '#ffffff',
+    'border_hover': '#00ffff',
+    'text_primary': '#ffffff',
+    'text_secondary': '#e0e0e0',
+    'text_disabled': '#808080',
+    'success': '#00ff00',
+    'warning': '#ffff00',
+    'error': '#ff0000',
+})
+
+
+class HighContrastTheme(Theme):
+    """High contrast theme for accessibility"""
+    
+    name = "High Contrast"
+    
+    _STYLESHEET_TEMPLATE = """
             QMainWindow {{
-                background-color: {self.colors['background']};
+                background-color: {background};
             }}
             QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
+                background-color: {background};
+                color: {text_primary};
                 font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 10pt;
+                font-size: 11pt;
             }}
             QMenuBar {{
-                background-color: {self.colors['surface_alt']};
-                border-bottom: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border-bottom: 2px solid {border};
                 padding: 4px;
             }}
             QMenuBar::item {{
                 background-color: transparent;
-                padding: 6px 12px;
+                padding: 8px 14px;
                 border-radius: 4px;
+                border: 1px solid transparent;
             }}
             QMenuBar::item:selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
-            }}
-            QMenuBar::item:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
+                background-color: {primary};
+                color: {background};
+                border: 1px solid {border};
             }}
             QMenu {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border: 2px solid {border};
                 border-radius: 6px;
                 padding: 4px;
             }}
             QMenu::item {{
-                padding: 6px 24px 6px 12px;
+                padding: 10px 26px 10px 14px;
                 border-radius: 4px;
+                border: 1px solid transparent;
             }}
             QMenu::item:selected {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
+                background-color: {primary};
+                color: {background};
+                border: 1px solid {border};
             }}
             QMenu::separator {{
-                height: 1px;
-                background: {self.colors['border']};
-                margin: 4px 8px;
+                height: 2px;
+                background: {border};
+                margin: 6px 10px;
             }}
             QToolBar {{
-                background-color: {self.colors['surface_alt']};
+                background-color: {surface};
                 border: none;
-                border-bottom: 1px solid {self.colors['border']};
-                spacing: 6px;
+                border-bottom: 2px solid {border};
+                spacing: 8px;
                 padding: 4px;
             }}
             QToolButton {{
                 background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                padding: 4px;
+                border: 2px solid transparent;
+                border-radius: 6px;
+                padding: 6px;
             }}
             QToolButton:hover {{
-                background-color: {self.colors['border']};
-                border-color: {self.colors['border']};
+                border-color: {border};
             }}
             QToolButton:pressed {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
+                background-color: {primary};
+                border-color: {primary};
             }}
             QStatusBar {{
-                background-color: {self.colors['surface_alt']};
-                border-top: 1px solid {self.colors['border']};
-                padding: 4px;
-                color: {self.colors['text_secondary']};
+                background-color: {surface};
+                border-top: 2px solid {border};
+                padding: 6px;
+                color: {text_primary};
             }}
             QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border: 2px solid {border};
                 border-radius: 8px;
                 margin-top: 16px;
                 padding-top: 16px;
@@ -1704,246 +635,403 @@ class NordTheme(Theme):
                 left: 16px;
                 top: 8px;
                 padding: 0 8px;
-                color: {self.colors['primary']};
-                font-size: 11pt;
+                color: {primary};
+                font-size: 12pt;
             }}
             QPushButton {{
-                background-color: {self.colors['primary']};
-                color: {self.colors['background']};
-                border: none;
+                background-color: {background};
+                color: {text_primary};
+                border: 2px solid {border};
                 border-radius: 6px;
-                padding: 6px 16px;
-                font-weight: 500;
+                padding: 10px 22px;
+                font-weight: bold;
                 min-width: 80px;
             }}
             QPushButton:hover {{
-                background-color: {self.colors['primary']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
+                background-color: {primary};
+                color: {background};
             }}
             QPushButton:pressed {{
-                background-color: {self.colors['primary']};
-                opacity: 0.8;
+                background-color: {border};
             }}
             QPushButton:disabled {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_disabled']};
+                border-color: {text_disabled};
+                color: {text_disabled};
             }}
             QPushButton#secondaryButton {{
-                background-color: {self.colors['border']};
-                color: {self.colors['text_primary']};
-            }}
-            QPushButton#secondaryButton:hover {{
-                background-color: {self.colors['border_hover']};
+                background-color: {surface};
             }}
             QCheckBox {{
-                spacing: 8px;
-                color: {self.colors['text_primary']};
+                spacing: 10px;
+                color: {text_primary};
             }}
             QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
+                width: 20px;
+                height: 20px;
                 border-radius: 4px;
-                border: 1px solid {self.colors['border']};
-                background-color: {self.colors['surface_alt']};
+                border: 2px solid {border};
+                background-color: {background};
             }}
             QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
+                background-color: {primary};
+                border-color: {primary};
             }}
             QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
+                border-color: {primary};
             }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
+            QLineEdit, QAbstractSpinBox, QComboBox {{
+                background-color: {background};
+                border: 2px solid {border};
                 border-radius: 6px;
-                padding: 6px 10px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
-            }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
+                padding: 8px 12px;
+                color: {text_primary};
+                selection-background-color: {primary};
+                selection-color: {background};
             }}
-            QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover, QComboBox:hover {{
-                border-color: {self.colors['border_hover']};
+            QLineEdit:focus, QAbstractSpinBox:focus, QComboBox:focus {{
+                border-color: {primary};
+                border-width: 3px;
             }}
             QComboBox::drop-down {{
                 border: none;
-                width: 24px;
+                width: 28px;
             }}
             QScrollArea {{
-                border: 1px solid {self.colors['border']};
+                border: 2px solid {border};
                 border-radius: 8px;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
             }}
             QScrollBar:vertical {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                width: 12px;
-                border-radius: 6px;
+                border: 2px solid {border};
+                background-color: {background};
+                width: 18px;
+                border-radius: 8px;
             }}
             QScrollBar::handle:vertical {{
-                background-color: {self.colors['border_hover']};
+                background-color: {border};
                 border-radius: 6px;
-                min-height: 30px;
+                min-height: 40px;
             }}
             QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['text_disabled']};
+                background-color: {primary};
             }}
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
             QScrollBar:horizontal {{
-                border: none;
-                background-color: {self.colors['surface_alt']};
-                height: 12px;
-                border-radius: 6px;
+                border: 2px solid {border};
+                background-color: {background};
+                height: 18px;
+                border-radius: 8px;
             }}
             QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border_hover']};
+                background-color: {border};
                 border-radius: 6px;
-                min-width: 30px;
+                min-width: 40px;
             }}
             QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['text_disabled']};
+                background-color: {primary};
             }}
             QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
                 width: 0px;
             }}
             QTableWidget {{
-                background-color: {self.colors['surface']};
-                alternate-background-color: {self.colors['surface_alt']};
-                gridline-color: {self.colors['border']};
-                border: 1px solid {self.colors['border']};
+                background-color: {background};
+                alternate-background-color: {surface};
+                gridline-color: {border};
+                border: 2px solid {border};
                 border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
-                selection-color: #ffffff;
+                selection-background-color: {primary};
+                selection-color: {background};
             }}
             QTableWidget::item {{
-                padding: 6px;
+                padding: 8px;
             }}
             QHeaderView::section {{
-                background-color: {self.colors['surface_alt']};
-                border: none;
-                border-right: 1px solid {self.colors['border']};
-                border-bottom: 1px solid {self.colors['border']};
-                padding: 8px;
+                background-color: {surface};
+                border: 2px solid {border};
+                border-right: none;
+                border-top: none;
+                padding: 10px;
                 font-weight: bold;
-                color: {self.colors['primary']};
-            }}
-            QHeaderView::section:hover {{
-                background-color: {self.colors['border']};
+                color: {primary};
             }}
             QTabWidget::pane {{
-                border: 1px solid {self.colors['border']};
+                border: 2px solid {border};
                 border-radius: 8px;
-                top: -1px;
-                background-color: {self.colors['surface']};
+                top: -2px;
+                background-color: {surface};
             }}
             QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface_alt};
+                border: 2px solid {border};
                 border-bottom: none;
                 border-top-left-radius: 8px;
                 border-top-right-radius: 8px;
-                padding: 8px 20px;
+                padding: 12px 22px;
                 margin-right: 4px;
-                font-weight: 500;
+                font-weight: bold;
             }}
             QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
+                background-color: {surface};
+                border-bottom-color: {surface};
+                color: {primary};
             }}
             QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['border']};
+                background-color: {primary};
+                color: {background};
             }}
             QSplitter::handle {{
-                background-color: {self.colors['border']};
-                width: 2px;
-                height: 2px;
+                background-color: {border};
+                width: 3px;
+                height: 3px;
             }}
             QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
             }}
             QLabel {{
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QProgressBar {{
-                border: 1px solid {self.colors['border']};
+                border: 2px solid {border};
                 border-radius: 6px;
-                background-color: {self.colors['surface_alt']};
+                background-color: {background};
                 text-align: center;
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 border-radius: 4px;
             }}
             QToolTip {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['primary']};
+                background-color: {surface};
+                color: {text_primary};
+                border: 2px solid {primary};
                 border-radius: 6px;
-                padding: 6px;
+                padding: 8px;
+                font-size: 11pt;
             }}
         """
     
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_secondary'],
-            'ytick.color': self.colors['text_secondary'],
-            'grid.color': self.colors['border_hover'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface_alt'],
-            'legend.edgecolor': self.colors['primary'],
-        }
+    _PLOT_STYLE_ROLES = {
+        'figure_facecolor': 'background',
+        'axes_facecolor': 'surface',
+        'axes_edgecolor': 'border',
+        'axes_labelcolor': 'text_primary',
+        'xtick_color': 'text_primary',
+        'ytick_color': 'text_primary',
+        'grid_color': 'border',
+        'text_color': 'text_primary',
+        'legend_facecolor': 'surface',
+        'legend_edgecolor': 'primary',
+    }
+    
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#00ffff', '#ff00ff', '#ffff00', '#00ff00', '#ff8800',
+        '#ff0088', '#88ff00', '#0088ff', '#ff0000', '#0000ff',
+        '#ff6600', '#66ff00', '#0066ff', '#ff0066', '#6600ff',
+        '#00ff66', '#ff6600', '#880088', '#008888', '#888800',
+    ))
+    
+    def __init__(self):
+        super().__init__()
+        self.colors = _HIGH_CONTRAST_COLORS
+
+
+# Read-only palette shared by every BlueTheme instance
+_BLUE_COLORS = _palette({
+    'primary': '#2196f3',
+    'background': '#0d1117',
+    'surface': '#161b22',
+    'surface_alt': '#21262d',
+    'border': '#30363d',
+    'border_hover': '#484f58',
+    'text_primary': '#c9d1d9',
+    'text_secondary': '#8b949e',
+    'text_disabled': '#6e7681',
+    'success': '#3fb950',
+    'warning': '#d29922',
+    'error': '#f85149',
+})
+
+
+class BlueTheme(Theme):
+    """Blue theme with calming blue tones"""
+    
+    name = "Blue"
+    
+    _STYLESHEET_TEMPLATE = _BASE_STYLESHEET_TEMPLATE
+    _STYLESHEET_ROLES = {
+        'panel_background': 'surface_alt',
+        'on_primary': '#ffffff',
+        'hover_background': 'border',
+        'button_disabled': 'border',
+        'secondary_button': 'border',
+        'secondary_button_hover': 'border_hover',
+        'scrollbar_track': 'surface_alt',
+        'scrollbar_handle': 'border_hover',
+        'scrollbar_handle_hover': 'text_disabled',
+        'alternate_row': '#1c2128',
+        'selection_text': '#ffffff',
+    }
+    
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#2196f3', '#f44336', '#4caf50', '#ff9800', '#9c27b0',
+        '#00bcd4', '#ffeb3b', '#e91e63', '#8bc34a', '#673ab7',
+        '#03a9f4', '#ff5722', '#cddc39', '#009688', '#ffc107',
+        '#3f51b5', '#795548', '#607d8b', '#ff6f00', '#00e676',
+    ))
+    
+    def __init__(self):
+        super().__init__()
+        self.colors = _BLUE_COLORS
+
+
+# Read-only palette shared by every SolarizedDarkTheme instance
+_SOLARIZED_DARK_COLORS = _palette({
+    'primary': '#268bd2',
+    'background': '#002b36',
+    'surface': '#073642',
+    'surface_alt': '#0e4050',
+    'border': '#586e75',
+    'border_hover': '#657b83',
+    'text_primary': '#839496',
+    'text_secondary': '#586e75',
+    'text_disabled': '#073642',
+    'success': '#859900',
+    'warning': '#b58900',
+    'error': '#dc322f',
+})
+
+
+class SolarizedDarkTheme(Theme):
+    """Solarized Dark theme - popular among developers"""
+    
+    name = "Solarized Dark"
+    
+    _STYLESHEET_TEMPLATE = _BASE_STYLESHEET_TEMPLATE
+    _STYLESHEET_ROLES = {
+        'panel_background': 'surface',
+        'on_primary': 'background',
+        'hover_background': 'surface_alt',
+        'button_disabled': 'surface_alt',
+        'secondary_button': 'surface_alt',
+        'secondary_button_hover': 'border',
+        'scrollbar_track': 'surface',
+        'scrollbar_handle': 'border',
+        'scrollbar_handle_hover': 'border_hover',
+        'alternate_row': 'surface_alt',
+        'selection_text': 'background',
+    }
+    
+    _PLOT_STYLE_ROLES = {
+        'figure_facecolor': 'background',
+        'axes_facecolor': 'surface',
+        'axes_edgecolor': 'border',
+        'axes_labelcolor': 'text_primary',
+        'xtick_color': 'text_secondary',
+        'ytick_color': 'text_secondary',
+        'grid_color': 'border',
+        'text_color': 'text_primary',
+        'legend_facecolor': 'surface',
+        'legend_edgecolor': 'primary',
+    }
+    
+    # The eight Solarized accents; callers cycle through them by index
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#268bd2', '#dc322f', '#859900', '#b58900',
+        '#d33682', '#2aa198', '#cb4b16', '#6c71c4',
+    ))
+    
+    def __init__(self):
+        super().__init__()
+        self.colors = _SOLARIZED_DARK_COLORS
+
+
+# Read-only palette shared by every NordTheme instance
+_NORD_COLORS = _palette({
+    'primary': '#88c0d0',
+    'background': '#2e3440',
+    'surface': '#3b4252',
+    'surface_alt': '#434c5e',
+    'border': '#4c566a',
+    'border_hover': '#5e6d8a',
+    'text_primary': '#eceff4',
+    'text_secondary': '#d8dee9',
+    'text_disabled': '#4c566a',
+    'success': '#a3be8c',
+    'warning': '#ebcb8b',
+    'error': '#bf616a',
+})
+
+
+class NordTheme(Theme):
+    """Nord theme - arctic, north-bluish color palette"""
+    
+    name = "Nord"
+    
+    _STYLESHEET_TEMPLATE = _BASE_STYLESHEET_TEMPLATE
+    _STYLESHEET_ROLES = {
+        'panel_background': 'surface_alt',
+        'on_primary': 'background',
+        'hover_background': 'border',
+        'button_disabled': 'border',
+        'secondary_button': 'border',
+        'secondary_button_hover': 'border_hover',
+        'scrollbar_track': 'surface_alt',
+        'scrollbar_handle': 'border_hover',
+        'scrollbar_handle_hover': 'text_disabled',
+        'alternate_row': 'surface_alt',
+        'selection_text': '#ffffff',
+    }
+    
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#88c0d0', '#bf616a', '#a3be8c', '#ebcb8b', '#b48ead',
+        '#5e81ac', '#d08770', '#8fbcbb', '#81a1c1', '#a3be8c',
+        '#88c0d0', '#bf616a', '#b48ead', '#d08770', '#ebcb8b',
+        '#5e81ac', '#8fbcbb', '#81a1c1', '#a3be8c', '#88c0d0',
+    ))
+    
+    def __init__(self):
+        super().__init__()
+        self.colors = _NORD_COLORS
+
+
+# Read-only palette shared by every ModernDarkTheme instance
+_MODERN_DARK_COLORS = _palette({
+    'primary': '#3794ff',
+    'background': '#181818',
+    'surface': '#1f1f1f',
+    'surface_alt': '#2b2b2b',
+    'border': '#3f3f3f',
+    'border_hover': '#505050',
+    'text_primary': '#e0e0e0',
+    'text_secondary': '#a0a0a0',
+    'text_disabled': '#606060',
+    'success': '#4ec9b0',
+    'warning': '#dcdcaa',
+    'error': '#f44747',
+})
 
 
 class ModernDarkTheme(Theme):
     """Modern Dark theme with refined colors and spacing"""
     
-    def __init__(self):
-        super().__init__("Modern Dark")
-        self.colors = {
-            'primary': '#3794ff',
-            'background': '#181818',
-            'surface': '#1f1f1f',
-            'surface_alt': '#2b2b2b',
-            'border': '#3f3f3f',
-            'border_hover': '#505050',
-            'text_primary': '#e0e0e0',
-            'text_secondary': '#a0a0a0',
-            'text_disabled': '#606060',
-            'success': '#4ec9b0',
-            'warning': '#dcdcaa',
-            'error': '#f44747',
-        }
-        self.plot_colors = [
-            '#3794ff', '#f44747', '#4ec9b0', '#dcdcaa', '#ce9178',
-            '#569cd6', '#9cdcfe', '#b5cea8', '#6a9955', '#d16969',
-            '#c586c0', '#4fc1ff', '#d7ba7d', '#f44747', '#dcdcaa',
-            '#9cdcfe', '#ce9178', '#4ec9b0', '#b5cea8', '#569cd6',
-        ]
-        
-    def get_stylesheet(self) -> str:
-        return f"""
+    name = "Modern Dark"
+    
+    _STYLESHEET_TEMPLATE = """
             QMainWindow {{
-                background-color: {self.colors['background']};
+                background-color: {background};
             }}
             QWidget {{
-                background-color: {self.colors['background']};
-                color: {self.colors['text_primary']};
+                background-color: {background};
+                color: {text_primary};
                 font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
                 font-size: 10pt;
             }}
             QMenuBar {{
-                background-color: {self.colors['surface']};
-                border-bottom: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border-bottom: 1px solid {border};
                 padding: 4px;
             }}
             QMenuBar::item {{
@@ -1952,15 +1040,15 @@ class ModernDarkTheme(Theme):
                 border-radius: 4px;
             }}
             QMenuBar::item:selected {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['primary']};
+                background-color: {surface_alt};
+                color: {primary};
             }}
             QMenuBar::item:pressed {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QMenu {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border: 1px solid {border};
                 border-radius: 8px;
                 padding: 6px;
             }}
@@ -1969,18 +1057,18 @@ class ModernDarkTheme(Theme):
                 border-radius: 4px;
             }}
             QMenu::item:selected {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 color: #ffffff;
             }}
             QMenu::separator {{
                 height: 1px;
-                background: {self.colors['border']};
+                background: {border};
                 margin: 4px 8px;
             }}
             QToolBar {{
-                background-color: {self.colors['surface']};
+                background-color: {surface};
                 border: none;
-                border-bottom: 1px solid {self.colors['border']};
+                border-bottom: 1px solid {border};
                 spacing: 8px;
                 padding: 6px;
             }}
@@ -1991,20 +1079,20 @@ class ModernDarkTheme(Theme):
                 padding: 6px;
             }}
             QToolButton:hover {{
-                background-color: {self.colors['surface_alt']};
+                background-color: {surface_alt};
             }}
             QToolButton:pressed {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QStatusBar {{
-                background-color: {self.colors['surface']};
-                border-top: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border-top: 1px solid {border};
                 padding: 6px;
-                color: {self.colors['text_secondary']};
+                color: {text_secondary};
             }}
             QGroupBox {{
-                background-color: {self.colors['surface']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                border: 1px solid {border};
                 border-radius: 8px;
                 margin-top: 16px;
                 padding-top: 16px;
@@ -2016,11 +1104,11 @@ class ModernDarkTheme(Theme):
                 left: 16px;
                 top: 8px;
                 padding: 0 8px;
-                color: {self.colors['primary']};
+                color: {primary};
                 font-size: 11pt;
             }}
             QPushButton {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 color: #ffffff;
                 border: none;
                 border-radius: 6px;
@@ -2035,223 +1123,257 @@ class ModernDarkTheme(Theme):
                 background-color: #2b7acc;
             }}
             QPushButton:disabled {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_disabled']};
+                background-color: {surface_alt};
+                color: {text_disabled};
             }}
             QPushButton#secondaryButton {{
-                background-color: {self.colors['surface_alt']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface_alt};
+                color: {text_primary};
+                border: 1px solid {border};
             }}
             QPushButton#secondaryButton:hover {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QCheckBox {{
                 spacing: 8px;
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QCheckBox::indicator {{
                 width: 18px;
                 height: 18px;
                 border-radius: 4px;
-                border: 1px solid {self.colors['border']};
-                background-color: {self.colors['surface_alt']};
+                border: 1px solid {border};
+                background-color: {surface_alt};
             }}
             QCheckBox::indicator:checked {{
-                background-color: {self.colors['primary']};
-                border-color: {self.colors['primary']};
+                background-color: {primary};
+                border-color: {primary};
             }}
             QCheckBox::indicator:hover {{
-                border-color: {self.colors['primary']};
+                border-color: {primary};
             }}
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
+            QLineEdit, QAbstractSpinBox, QComboBox {{
+                background-color: {surface_alt};
+                border: 1px solid {border};
                 border-radius: 6px;
                 padding: 6px 10px;
-                color: {self.colors['text_primary']};
-                selection-background-color: {self.colors['primary']};
+                color: {text_primary};
+                selection-background-color: {primary};
             }}
-            QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
-                border-color: {self.colors['primary']};
-                background-color: {self.colors['surface']};
+            QLineEdit:focus, QAbstractSpinBox:focus, QComboBox:focus {{
+                border-color: {primary};
+                background-color: {surface};
             }}
-            QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover, QComboBox:hover {{
-                border-color: {self.colors['border_hover']};
+            QLineEdit:hover, QAbstractSpinBox:hover, QComboBox:hover {{
+                border-color: {border_hover};
             }}
             QComboBox::drop-down {{
                 border: none;
                 width: 24px;
             }}
             QScrollArea {{
-                border: 1px solid {self.colors['border']};
+                border: 1px solid {border};
                 border-radius: 8px;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
             }}
             QScrollBar:vertical {{
                 border: none;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
                 width: 12px;
                 border-radius: 6px;
             }}
             QScrollBar::handle:vertical {{
-                background-color: {self.colors['border']};
+                background-color: {border};
                 border-radius: 6px;
                 min-height: 30px;
             }}
             QScrollBar::handle:vertical:hover {{
-                background-color: {self.colors['border_hover']};
+                background-color: {border_hover};
             }}
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
             QScrollBar:horizontal {{
                 border: none;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
                 height: 12px;
                 border-radius: 6px;
             }}
             QScrollBar::handle:horizontal {{
-                background-color: {self.colors['border']};
+                background-color: {border};
                 border-radius: 6px;
                 min-width: 30px;
             }}
             QScrollBar::handle:horizontal:hover {{
-                background-color: {self.colors['border_hover']};
+                background-color: {border_hover};
             }}
             QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
                 width: 0px;
             }}
             QTableWidget {{
-                background-color: {self.colors['surface']};
-                alternate-background-color: {self.colors['surface_alt']};
-                gridline-color: {self.colors['border']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                alternate-background-color: {surface_alt};
+                gridline-color: {border};
+                border: 1px solid {border};
                 border-radius: 8px;
-                selection-background-color: {self.colors['primary']};
+                selection-background-color: {primary};
                 selection-color: white;
             }}
             QTableWidget::item {{
                 padding: 6px;
             }}
             QHeaderView::section {{
-                background-color: {self.colors['surface_alt']};
+                background-color: {surface_alt};
                 border: none;
-                border-right: 1px solid {self.colors['border']};
-                border-bottom: 1px solid {self.colors['border']};
+                border-right: 1px solid {border};
+                border-bottom: 1px solid {border};
                 padding: 8px;
                 font-weight: bold;
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QHeaderView::section:hover {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QTabWidget::pane {{
-                border: 1px solid {self.colors['border']};
+                border: 1px solid {border};
                 border-radius: 8px;
                 top: -1px;
-                background-color: {self.colors['surface']};
+                background-color: {surface};
             }}
             QTabBar::tab {{
-                background-color: {self.colors['surface_alt']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface_alt};
+                border: 1px solid {border};
                 border-bottom: none;
                 border-top-left-radius: 8px;
                 border-top-right-radius: 8px;
                 padding: 8px 20px;
                 margin-right: 4px;
                 font-weight: 500;
-                color: {self.colors['text_secondary']};
+                color: {text_secondary};
             }}
             QTabBar::tab:selected {{
-                background-color: {self.colors['surface']};
-                border-bottom-color: {self.colors['surface']};
-                color: {self.colors['primary']};
+                background-color: {surface};
+                border-bottom-color: {surface};
+                color: {primary};
             }}
             QTabBar::tab:hover:!selected {{
-                background-color: {self.colors['border']};
+                background-color: {border};
             }}
             QSplitter::handle {{
-                background-color: {self.colors['border']};
+                background-color: {border};
                 width: 1px;
                 height: 1px;
             }}
             QSplitter::handle:hover {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
             }}
             QLabel {{
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QProgressBar {{
-                border: 1px solid {self.colors['border']};
+                border: 1px solid {border};
                 border-radius: 6px;
-                background-color: {self.colors['surface_alt']};
+                background-color: {surface_alt};
                 text-align: center;
-                color: {self.colors['text_primary']};
+                color: {text_primary};
             }}
             QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
+                background-color: {primary};
                 border-radius: 4px;
             }}
             QToolTip {{
-                background-color: {self.colors['surface']};
-                color: {self.colors['text_primary']};
-                border: 1px solid {self.colors['border']};
+                background-color: {surface};
+                color: {text_primary};
+                border: 1px solid {border};
                 border-radius: 6px;
                 padding: 6px;
             }}
         """
     
-    def get_plot_style(self) -> Dict:
-        return {
-            'figure.facecolor': self.colors['background'],
-            'axes.facecolor': self.colors['surface'],
-            'axes.edgecolor': self.colors['border'],
-            'axes.labelcolor': self.colors['text_primary'],
-            'xtick.color': self.colors['text_secondary'],
-            'ytick.color': self.colors['text_secondary'],
-            'grid.color': self.colors['border'],
-            'text.color': self.colors['text_primary'],
-            'legend.facecolor': self.colors['surface'],
-            'legend.edgecolor': self.colors['border'],
-        }
+    _PLOT_STYLE_ROLES = {
+        'figure_facecolor': 'background',
+        'axes_facecolor': 'surface',
+        'axes_edgecolor': 'border',
+        'axes_labelcolor': 'text_primary',
+        'xtick_color': 'text_secondary',
+        'ytick_color': 'text_secondary',
+        'grid_color': 'border',
+        'text_color': 'text_primary',
+        'legend_facecolor': 'surface',
+        'legend_edgecolor': 'border',
+    }
+    
+    plot_colors = tuple(sys.intern(color) for color in (
+        '#3794ff', '#f44747', '#4ec9b0', '#dcdcaa', '#ce9178',
+        '#569cd6', '#9cdcfe', '#b5cea8', '#6a9955', '#d16969',
+        '#c586c0', '#4fc1ff', '#d7ba7d', '#f44747', '#dcdcaa',
+        '#9cdcfe', '#ce9178', '#4ec9b0', '#b5cea8', '#569cd6',
+    ))
+    
+    def __init__(self):
+        super().__init__()
+        self.colors = _MODERN_DARK_COLORS
 
 
-# Available themes
-THEMES = {
-    'modern_dark': ModernDarkTheme(),
-    'dark': DarkTheme(),
-    'light': LightTheme(),
-    'high_contrast': HighContrastTheme(),
-    'blue': BlueTheme(),
-    'solarized_dark': SolarizedDarkTheme(),
-    'nord': NordTheme(),
+# Available themes (instantiated on first use)
+THEME_CLASSES = {
+    'modern_dark': ModernDarkTheme,
+    'dark': DarkTheme,
+    'light': LightTheme,
+    'high_contrast': HighContrastTheme,
+    'blue': BlueTheme,
+    'solarized_dark': SolarizedDarkTheme,
+    'nord': NordTheme,
 }
 
+# Theme names in menu order, fixed once the registry is defined
+_THEME_NAMES = tuple(THEME_CLASSES)
+
+# Theme instances created so far, keyed by theme name
+_theme_instances: Dict[str, Theme] = {}
+
 # Default theme
 DEFAULT_THEME = 'modern_dark'
 
-# Current theme
-_current_theme = THEMES[DEFAULT_THEME]
+
+def get_theme_by_name(theme_name: str) -> Theme:
+    """Get a specific theme by name, creating it on first use"""
+    if theme_name not in THEME_CLASSES:
+        theme_name = DEFAULT_THEME
+    theme = _theme_instances.get(theme_name)
+    if theme is None:
+        theme = _theme_instances[theme_name] = THEME_CLASSES[theme_name]()
+    return theme
+
+
+# Current theme (the default theme is created on first use)
+_current_theme_name = DEFAULT_THEME
+_current_theme: Optional[Theme] = None
 
 
 def get_current_theme() -> Theme:
     """Get current theme"""
+    global _current_theme
+    if _current_theme is None:
+        _current_theme = get_theme_by_name(_current_theme_name)
     return _current_theme
 
 
-def set_theme(theme_name: str):
-    """Set current theme"""
-    global _current_theme
-    if theme_name in THEMES:
-        _current_theme = THEMES[theme_name]
+def set_theme(theme_name: str) -> bool:
+    """Set current theme, returning whether it actually changed"""
+    global _current_theme, _current_theme_name
+    if theme_name not in THEME_CLASSES or theme_name == _current_theme_name:
+        return False
+    _current_theme_name = theme_name
+    _current_theme = get_theme_by_name(theme_name)
+    return True
 
 
-def get_theme_names() -> list:
-    """Get list of available theme names"""
-    return list(THEMES.keys())
+def get_theme_names() -> Tuple[str, ...]:
+    """Get the available theme names"""
+    return _THEME_NAMES
 
 
-def get_theme_by_name(theme_name: str) -> Theme:
-    """Get a specific theme by name"""
-    return THEMES.get(theme_name, THEMES[DEFAULT_THEME])
+def get_theme_display_name(theme_name: str) -> str:
+    """Get the display name of a theme without creating it"""
+    return THEME_CLASSES.get(theme_name, THEME_CLASSES[DEFAULT_THEME]).name
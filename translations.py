@@ -4,10 +4,12 @@ Internationalization support for XBlackBox XDR Viewer
 """
 
 import locale
-from typing import Dict
+import os
+from types import MappingProxyType
+from typing import Optional
 
 # Translation dictionaries
-TRANSLATIONS = {
+_TABLES = {
     'en_US': {
         # Window title
         'window_title': 'XBlackBox XDR Viewer - Modern Edition',
@@ -930,63 +932,112 @@ TRANSLATIONS = {
     }
 }
 
+# Read-only views of the translation dictionaries; tr() looks keys up in the
+# plain dicts directly, since a mappingproxy adds a method call per lookup
+TRANSLATIONS = MappingProxyType({lang: MappingProxyType(table) for lang, table in _TABLES.items()})
+
 # Default language
 DEFAULT_LANGUAGE = 'system'
 DEFAULT_FALLBACK_LANGUAGE = 'en_US'
 
+# Language used for each system locale prefix
+_LOCALE_LANGUAGES = {
+    'zh': 'zh_CN',
+    'ja': 'ja_JP',
+    'es': 'es_ES',
+    'fr': 'fr_FR',
+}
 
-class Translator:
-    """Translation manager"""
-    
-    def __init__(self):
-        self.current_language = DEFAULT_FALLBACK_LANGUAGE
-        self._detect_system_language()
-        
-    def _detect_system_language(self):
-        """Detect system language"""
+
+# Environment variables holding the locale, in the order locale.getdefaultlocale() checks them
+_LOCALE_ENV_VARS = ('LC_ALL', 'LC_CTYPE', 'LANG', 'LANGUAGE')
+
+
+def _system_language() -> Optional[str]:
+    """Map the system locale to a supported language, or None if it is unknown"""
+    sys_locale = next(filter(None, map(os.environ.get, _LOCALE_ENV_VARS)), None)
+    if sys_locale is None:
+        # No locale in the environment (e.g. on Windows), ask the platform
         try:
             sys_locale = locale.getdefaultlocale()[0]
-            if sys_locale:
-                if sys_locale.startswith('zh'):
-                    self.current_language = 'zh_CN'
-                elif sys_locale.startswith('ja'):
-                    self.current_language = 'ja_JP'
-                elif sys_locale.startswith('es'):
-                    self.current_language = 'es_ES'
-                elif sys_locale.startswith('fr'):
-                    self.current_language = 'fr_FR'
-                else:
-                    self.current_language = DEFAULT_FALLBACK_LANGUAGE
         except (locale.Error, TypeError, ValueError):
-            self.current_language = DEFAULT_FALLBACK_LANGUAGE
+            return DEFAULT_FALLBACK_LANGUAGE
+    if not sys_locale or sys_locale in ('C', 'POSIX') or sys_locale.startswith('C.'):
+        return None
+    return _LOCALE_LANGUAGES.get(sys_locale[:2], DEFAULT_FALLBACK_LANGUAGE)
+
+
+# The system locale doesn't change while the app runs, so it is only parsed once
+_SYSTEM_LANGUAGE = _system_language()
+
+
+# Bound get of each language's translations, built once at import. Keys a
+# language lacks fall back to English, merged in up front so that tr() stays
+# a single lookup instead of probing a second table on every miss.
+_LOOKUPS = {
+    lang: (table if lang == DEFAULT_FALLBACK_LANGUAGE
+           else {**_TABLES[DEFAULT_FALLBACK_LANGUAGE], **table}).get
+    for lang, table in _TABLES.items()
+}
+
+# Current language and its lookup
+_current_language = DEFAULT_FALLBACK_LANGUAGE
+_lookup = _LOOKUPS[DEFAULT_FALLBACK_LANGUAGE]
+
+
+def _activate(lang_code: str):
+    """Make lang_code the current language"""
+    global _current_language, _lookup
+    _current_language = lang_code
+    _lookup = _LOOKUPS[lang_code]
+
+
+def _detect_system_language():
+    """Switch to the system language, if it could be determined"""
+    if _SYSTEM_LANGUAGE is not None:
+        _activate(_SYSTEM_LANGUAGE)
+
+
+def tr(key: str) -> str:
+    """Translate a key"""
+    return _lookup(key, key)
+
+
+def set_language(lang_code: str):
+    """Set application language"""
+    if lang_code in TRANSLATIONS:
+        _activate(lang_code)
+    elif lang_code == 'system':
+        _detect_system_language()
+
+
+def get_current_language() -> str:
+    """Get current language code"""
+    return _current_language
+
+
+class Translator:
+    """Translation manager (kept for compatibility; forwards to the module functions)"""
+    
+    # All state is module-level, so instances need no __dict__
+    __slots__ = ()
+    
+    @property
+    def current_language(self) -> str:
+        return _current_language
     
     def set_language(self, lang_code: str):
         """Set current language"""
-        if lang_code in TRANSLATIONS:
-            self.current_language = lang_code
-        elif lang_code == 'system':
-            self._detect_system_language()
+        set_language(lang_code)
     
     def tr(self, key: str) -> str:
         """Translate a key"""
-        return TRANSLATIONS.get(self.current_language, TRANSLATIONS['en_US']).get(key, key)
+        return _lookup(key, key)
     
     def get_current_language(self) -> str:
         """Get current language code"""
-        return self.current_language
-
-
-# Global translator instance
-_translator = Translator()
-
-def tr(key: str) -> str:
-    """Convenience function for translation"""
-    return _translator.tr(key)
+        return _current_language
 
-def set_language(lang_code: str):
-    """Set application language"""
-    _translator.set_language(lang_code)
 
-def get_current_language() -> str:
-    """Get current language code"""
-    return _translator.get_current_language()
+# Start in the system language
+_detect_system_language()
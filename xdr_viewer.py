@@ -47,18 +47,61 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
 # Import theme and translation systems
-from themes import get_current_theme, set_theme, get_theme_names, get_theme_by_name, DEFAULT_THEME
+from themes import get_current_theme, set_theme, get_theme_names, get_theme_display_name, DEFAULT_THEME
 from translations import tr, set_language, get_current_language, DEFAULT_LANGUAGE
 
 
+class FrameView:
+    """Read-only list of frame dicts, built on access from the XDRData columns"""
+    
+    def __init__(self, data: 'XDRData'):
+        self._data = data
+        
+    def __len__(self) -> int:
+        return len(self._data.timestamps)
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]  # Resolve negative indices, raise IndexError
+        data = self._data
+        values = []
+        for i, dr in enumerate(data.datarefs):
+            if dr['type'] == 'string':
+                # String arrays are not recorded, so they have no values
+                values.append(data.string_columns[i][index] if dr['array_size'] == 0 else [])
+            elif dr['array_size'] > 0:
+                values.append([data.columns[(i, j)][index].item() for j in range(dr['array_size'])])
+            else:
+                values.append(data.columns[(i, 0)][index].item())
+        return {'timestamp': data.timestamps[index].item(), 'values': values}
+        
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
 class XDRData:
     """Container for XDR file data"""
     
+    # Frames checked first when looking for the end of a run of same-layout frames
+    RUN_PROBE_FRAMES = 64
+    # Runs shorter than this are parsed field by field instead of with np.frombuffer
+    MIN_RUN_FRAMES = 16
+    
     def __init__(self):
         self.filepath = ""
         self.header = {}
         self.datarefs = []
-        self.frames = []
+        self.timestamps = np.empty(0)  # Frame timestamps, one float64 per frame
+        self.columns = {}              # (dataref_index, array_index) -> numeric values per frame
+        self.string_columns = {}       # dataref_index -> string values per frame
+        self.frames = FrameView(self)
+        self._timestamp_buffer = np.empty(0)  # Column storage, with room to append
+        self._column_buffers = {}
+        self._frame_dtypes = {}    # Structured frame dtypes, keyed by string lengths
+        self._string_gaps = []     # Numeric bytes before each string in a frame
+        self._frame_tail = 0       # Numeric bytes after the last string
         self._data_start_pos = 0  # Position where frame data starts
         self._last_read_pos = 0   # Last read position for incremental reading
         self._is_complete = False # Whether file has ENDR marker
@@ -67,7 +110,15 @@ class XDRData:
         self.filepath = ""
         self.header = {}
         self.datarefs = []
-        self.frames = []
+        self.timestamps = np.empty(0)
+        self.columns = {}
+        self.string_columns = {}
+        self.frames = FrameView(self)
+        self._timestamp_buffer = np.empty(0)
+        self._column_buffers = {}
+        self._frame_dtypes = {}
+        self._string_gaps = []
+        self._frame_tail = 0
         self._data_start_pos = 0
         self._last_read_pos = 0
         self._is_complete = False
@@ -80,6 +131,7 @@ class XDRData:
         with open(filepath, 'rb') as f:
             self._read_header(f)
             self._read_dataref_definitions(f)
+            self._init_columns()
             self._data_start_pos = f.tell()  # Save position where frames start
             self._read_frames(f)
             self._try_read_footer(f)
@@ -94,45 +146,14 @@ class XDRData:
         try:
             with open(self.filepath, 'rb') as f:
                 f.seek(self._last_read_pos)
+                consumed, new_frame_count = self._read_frame_data(f.read())
+                self._last_read_pos += consumed
                 
-                while True:
-                    marker = f.read(4)
-                    if len(marker) < 4:
-                        # Not enough data yet
-                        break
-                    if marker == b'ENDR':
-                        # End of recording
-                        self._is_complete = True
-                        self._read_footer_data(f)
-                        self._last_read_pos = f.tell()
-                        break
-                    if marker != b'DATA':
-                        # Unknown marker or incomplete data, back up
-                        break
-                        
-                    # Try to read the frame
-                    timestamp_data = f.read(4)
-                    if len(timestamp_data) < 4:
-                        # Incomplete frame
-                        break
-                        
-                    timestamp = struct.unpack('<f', timestamp_data)[0]
-                    
-                    # Calculate expected frame size
-                    frame_size = self._calc_frame_value_size()
-                    values_data = f.read(frame_size)
-                    if len(values_data) < frame_size:
-                        # Incomplete frame
-                        break
-                        
-                    # Parse values from buffer
-                    values = self._parse_frame_values(values_data)
-                    
-                    self.frames.append({
-                        'timestamp': timestamp,
-                        'values': values
-                    })
-                    new_frame_count += 1
+                f.seek(self._last_read_pos)
+                if f.read(4) == b'ENDR':
+                    # End of recording
+                    self._is_complete = True
+                    self._read_footer_data(f)
                     self._last_read_pos = f.tell()
                     
         except Exception:
@@ -140,51 +161,27 @@ class XDRData:
             
         return new_frame_count
         
-    def _calc_frame_value_size(self) -> int:
-        """Calculate the byte size of one frame's values"""
-        size = 0
-        for dr in self.datarefs:
-            if dr['array_size'] > 0:
-                size += 4 * dr['array_size']  # float or int array
-            else:
-                if dr['type'] == 'float':
-                    size += 4
-                elif dr['type'] == 'int':
-                    size += 4
-                elif dr['type'] == 'string':
-                    size += 1  # Just the length byte minimum
-        return size
-        
-    def _parse_frame_values(self, data: bytes) -> List:
-        """Parse frame values from bytes buffer"""
+    def _parse_frame_values(self, data: bytes, pos: int = 0) -> List:
+        """Parse frame values from bytes buffer, starting at pos"""
         values = []
-        pos = 0
         for dr in self.datarefs:
-            if dr['array_size'] > 0:
-                arr = []
-                for _ in range(dr['array_size']):
-                    if dr['type'] == 'float':
-                        arr.append(struct.unpack('<f', data[pos:pos+4])[0])
-                        pos += 4
-                    elif dr['type'] == 'int':
-                        arr.append(struct.unpack('<i', data[pos:pos+4])[0])
-                        pos += 4
-                values.append(arr)
+            if dr['type'] == 'string':
+                if dr['array_size'] > 0:
+                    # String arrays are not recorded
+                    values.append([])
+                    continue
+                str_len = data[pos]
+                pos += 1
+                values.append(data[pos:pos+str_len].decode('utf-8'))
+                pos += str_len
             else:
-                if dr['type'] == 'float':
-                    values.append(struct.unpack('<f', data[pos:pos+4])[0])
-                    pos += 4
-                elif dr['type'] == 'int':
-                    values.append(struct.unpack('<i', data[pos:pos+4])[0])
+                code = 'f' if dr['type'] == 'float' else 'i'
+                if dr['array_size'] > 0:
+                    values.append(list(struct.unpack_from(f"<{dr['array_size']}{code}", data, pos)))
+                    pos += 4 * dr['array_size']
+                else:
+                    values.append(struct.unpack_from('<' + code, data, pos)[0])
                     pos += 4
-                elif dr['type'] == 'string':
-                    str_len = data[pos]
-                    pos += 1
-                    if str_len > 0:
-                        values.append(data[pos:pos+str_len].decode('utf-8'))
-                        pos += str_len
-                    else:
-                        values.append('')
         return values
         
     def _try_read_footer(self, f):
@@ -195,10 +192,11 @@ class XDRData:
                 self._is_complete = True
                 self._read_footer_data(f)
             else:
-                # No footer yet, file is being written
+                # No footer yet, file is being written. Go back over whatever
+                # was read, even a partial marker, so that live reads resume
+                # at the start of the next frame.
                 self._is_complete = False
-                if len(marker) == 4:
-                    f.seek(-4, 1)  # Go back
+                f.seek(-len(marker), 1)
         except:
             self._is_complete = False
             
@@ -260,65 +258,228 @@ class XDRData:
             
     def _read_frames(self, f):
         """Read all data frames (handles incomplete files for live reading)"""
+        start_pos = f.tell()
+        consumed, _ = self._read_frame_data(f.read())
+        # Leave the file at the footer, or at the first incomplete frame
+        f.seek(start_pos + consumed)
+        
+    def _read_frame_data(self, buf: bytes) -> tuple:
+        """Append the complete frames at the start of buf to the columns
+        
+        Frames are parsed in runs that share one byte layout, i.e. the same
+        string lengths, with a single np.frombuffer per run.
+        
+        Returns:
+            tuple[int, int]: (bytes consumed, frames read)
+        """
+        pos = 0
+        frame_count = 0
+        rows = []
+        field_by_field = 0  # Frames left to parse without looking for a run
         while True:
-            marker = f.read(4)
-            if len(marker) < 4:
-                # Incomplete data
-                break
-            if marker == b'ENDR':
-                f.seek(-4, 1)
-                break
-            if marker != b'DATA':
-                # Unknown marker, might be incomplete - stop reading
-                f.seek(-4, 1)
-                break
-                
-            # Try to read timestamp
-            ts_data = f.read(4)
-            if len(ts_data) < 4:
-                f.seek(-4 - len(ts_data), 1)
+            layout = self._frame_layout(buf, pos)
+            if layout is None:
                 break
-                
-            timestamp = struct.unpack('<f', ts_data)[0]
+            string_lengths, end = layout
             
-            # Try to read frame values
-            start_pos = f.tell()
+            if not field_by_field:
+                records = self._parse_frame_run(buf, pos, string_lengths)
+                if len(records) >= self.MIN_RUN_FRAMES:
+                    timestamps, values, strings = self._record_columns(records)
+                    if len(timestamps):
+                        self._append_frames(*self._row_columns(rows))
+                        rows = []
+                        self._append_frames(timestamps, values, strings)
+                        pos += len(timestamps) * records.dtype.itemsize
+                        frame_count += len(timestamps)
+                        continue
+                # Short runs (string lengths keep changing) are cheaper field by
+                # field; don't probe again on every one of their frames
+                field_by_field = self.MIN_RUN_FRAMES
+                
+            field_by_field -= 1
             try:
-                values = self._read_frame_values(f)
-                self.frames.append({
-                    'timestamp': timestamp,
-                    'values': values
-                })
-                self._last_read_pos = f.tell()
-            except:
-                # Incomplete frame, go back
-                f.seek(start_pos - 8, 0)  # Go back before DATA marker
+                values = self._parse_frame_values(buf, pos + 8)
+            except UnicodeDecodeError:
                 break
+            rows.append((struct.unpack_from('<f', buf, pos + 4)[0], values))
+            frame_count += 1
+            pos = end
             
-    def _read_frame_values(self, f):
-        """Read values for one frame"""
-        values = []
-        for dr in self.datarefs:
-            if dr['array_size'] > 0:
-                arr = []
-                for _ in range(dr['array_size']):
-                    if dr['type'] == 'float':
-                        arr.append(struct.unpack('<f', f.read(4))[0])
-                    elif dr['type'] == 'int':
-                        arr.append(struct.unpack('<i', f.read(4))[0])
-                values.append(arr)
+        self._append_frames(*self._row_columns(rows))
+        return pos, frame_count
+        
+    def _frame_layout(self, buf: bytes, pos: int) -> Optional[tuple]:
+        """Get the string lengths and end offset of the frame at pos
+        
+        Returns None if no complete frame starts at pos.
+        """
+        if buf[pos:pos + 4] != b'DATA':
+            return None
+        offset = pos + 8
+        string_lengths = []
+        for gap in self._string_gaps:
+            # A string is its length byte plus data
+            offset += gap
+            if offset >= len(buf):
+                return None
+            string_lengths.append(buf[offset])
+            offset += 1 + buf[offset]
+        offset += self._frame_tail
+        if offset > len(buf):
+            return None
+        return tuple(string_lengths), offset
+        
+    def _frame_dtype(self, string_lengths: tuple) -> np.dtype:
+        """Build a structured dtype matching one frame with the given string lengths"""
+        frame_dtype = self._frame_dtypes.get(string_lengths)
+        if frame_dtype is not None:
+            return frame_dtype
+            
+        fields = [('marker', 'S4'), ('timestamp', '<f4')]
+        lengths = iter(string_lengths)
+        for i, dr in enumerate(self.datarefs):
+            if dr['type'] == 'string':
+                if dr['array_size'] == 0:
+                    length = next(lengths)
+                    fields.append((f'n{i}', 'u1'))
+                    if length:
+                        fields.append((f's{i}', f'S{length}'))
+            elif dr['array_size'] > 0:
+                fields.append((f'd{i}', self._value_dtype(dr), (dr['array_size'],)))
             else:
-                if dr['type'] == 'float':
-                    values.append(struct.unpack('<f', f.read(4))[0])
-                elif dr['type'] == 'int':
-                    values.append(struct.unpack('<i', f.read(4))[0])
-                elif dr['type'] == 'string':
-                    str_len = struct.unpack('<B', f.read(1))[0]
-                    if str_len > 0:
-                        values.append(f.read(str_len).decode('utf-8'))
-                    else:
-                        values.append('')
-        return values
+                fields.append((f'd{i}', self._value_dtype(dr)))
+        frame_dtype = self._frame_dtypes[string_lengths] = np.dtype(fields)
+        return frame_dtype
+        
+    @staticmethod
+    def _value_dtype(dr: Dict) -> str:
+        """NumPy dtype of one value of a numeric dataref"""
+        return '<f4' if dr['type'] == 'float' else '<i4'
+        
+    def _parse_frame_run(self, buf: bytes, pos: int, string_lengths: tuple) -> np.ndarray:
+        """Parse the frames from pos on that have the given string lengths"""
+        frame_dtype = self._frame_dtype(string_lengths)
+        available = (len(buf) - pos) // frame_dtype.itemsize
+        
+        # Check a few frames first, so that short runs don't scan the whole buffer
+        count = min(available, self.RUN_PROBE_FRAMES)
+        while True:
+            records = np.frombuffer(buf, dtype=frame_dtype, count=count, offset=pos)
+            
+            # The run ends at the footer, at a frame still being written, or
+            # where a string length changes and the frames stop lining up
+            valid = records['marker'] == b'DATA'
+            lengths = iter(string_lengths)
+            for i, dr in enumerate(self.datarefs):
+                if dr['type'] == 'string' and dr['array_size'] == 0:
+                    valid &= records[f'n{i}'] == next(lengths)
+            bad = np.flatnonzero(~valid)
+            if bad.size:
+                return records[:bad[0]]
+            if count == available:
+                return records
+            count = available
+        
+    def _record_columns(self, records: np.ndarray) -> tuple:
+        """Split frame records into timestamps, numeric columns and string columns
+        
+        Stops before the first frame holding a string that is not valid UTF-8.
+        """
+        count = len(records)
+        strings = {}
+        for i, dr in enumerate(self.datarefs):
+            if dr['type'] != 'string' or dr['array_size'] > 0:
+                continue
+            if f's{i}' not in records.dtype.names:
+                strings[i] = [''] * count
+                continue
+            # Decode each distinct string once; frames share the decoded objects
+            raw_values, inverse = np.unique(records[f's{i}'], return_inverse=True)
+            texts = []
+            for code, raw in enumerate(raw_values.tolist()):
+                try:
+                    texts.append(raw.decode('utf-8'))
+                except UnicodeDecodeError:
+                    texts.append('')
+                    count = min(count, int(np.flatnonzero(inverse == code)[0]))
+            strings[i] = [texts[code] for code in inverse.tolist()]
+            
+        records = records[:count]
+        strings = {i: column[:count] for i, column in strings.items()}
+        values = {}
+        for i, dr in enumerate(self.datarefs):
+            if dr['type'] == 'string':
+                continue
+            size = max(dr['array_size'], 1)
+            field = records[f'd{i}'].reshape(count, size)
+            for j in range(size):
+                values[(i, j)] = field[:, j]
+        return records['timestamp'], values, strings
+        
+    def _row_columns(self, rows: List) -> tuple:
+        """Split (timestamp, values) rows into timestamps, numeric columns and string columns"""
+        values = {}
+        strings = {}
+        for i, dr in enumerate(self.datarefs):
+            if dr['type'] == 'string':
+                if dr['array_size'] == 0:
+                    strings[i] = [row[i] for _, row in rows]
+                continue
+            size = max(dr['array_size'], 1)
+            field = np.array([row[i] for _, row in rows], dtype=self._value_dtype(dr))
+            field = field.reshape(len(rows), size)
+            for j in range(size):
+                values[(i, j)] = field[:, j]
+        return [timestamp for timestamp, _ in rows], values, strings
+        
+    def _init_columns(self):
+        """Create empty column storage and the frame layout for the datarefs just read"""
+        gap = 0
+        for i, dr in enumerate(self.datarefs):
+            if dr['type'] == 'string':
+                # String arrays are not recorded
+                if dr['array_size'] == 0:
+                    self.string_columns[i] = []
+                    self._string_gaps.append(gap)
+                    gap = 0
+                continue
+            for j in range(max(dr['array_size'], 1)):
+                self._column_buffers[(i, j)] = np.empty(0, dtype=self._value_dtype(dr))
+            gap += 4 * max(dr['array_size'], 1)
+        self._frame_tail = gap
+        self.columns = dict(self._column_buffers)
+                
+    def _append_frames(self, timestamps, values: Dict, strings: Dict):
+        """Append parsed frames to the columns, growing their storage geometrically"""
+        start = len(self.timestamps)
+        end = start + len(timestamps)
+        if end == start:
+            return
+            
+        if end > len(self._timestamp_buffer):
+            # Live mode appends a few frames per poll, so double rather than
+            # copying every column on each append
+            capacity = max(end, 2 * len(self._timestamp_buffer))
+            self._timestamp_buffer = self._grow_buffer(self._timestamp_buffer, start, capacity)
+            for key, buffer in self._column_buffers.items():
+                self._column_buffers[key] = self._grow_buffer(buffer, start, capacity)
+                
+        self._timestamp_buffer[start:end] = timestamps
+        for key, column in values.items():
+            self._column_buffers[key][start:end] = column
+        for i, column in strings.items():
+            self.string_columns[i].extend(column)
+            
+        self.timestamps = self._timestamp_buffer[:end]
+        self.columns = {key: buffer[:end] for key, buffer in self._column_buffers.items()}
+        
+    @staticmethod
+    def _grow_buffer(buffer: np.ndarray, length: int, capacity: int) -> np.ndarray:
+        """Copy the first length items of buffer into a new buffer of the given capacity"""
+        grown = np.empty(capacity, dtype=buffer.dtype)
+        grown[:length] = buffer[:length]
+        return grown
         
     def get_parameter_data(self, dataref_index: int, array_index: int = 0, 
                           time_range: Optional[tuple] = None, 
@@ -331,56 +492,74 @@ class XDRData:
             time_range: Optional (start_time, end_time) tuple to filter data
             downsample_factor: Factor to downsample data (1=no downsampling)
         """
-        timestamps = []
-        values = []
+        timestamps, values = self._get_parameter_arrays(
+            dataref_index, array_index, time_range, downsample_factor
+        )
+        return timestamps.tolist(), values.tolist()
         
+    def _get_parameter_arrays(self, dataref_index: int, array_index: int = 0,
+                              time_range: Optional[tuple] = None,
+                              downsample_factor: int = 1) -> tuple:
+        """Same as get_parameter_data, but returns NumPy arrays sliced from the columns"""
         dr = self.datarefs[dataref_index]
-        
-        for i, frame in enumerate(self.frames):
-            # Apply downsampling
-            if i % downsample_factor != 0:
-                continue
-                
-            timestamp = frame['timestamp']
+        values = self.columns.get((dataref_index, array_index if dr['array_size'] > 0 else 0))
+        if values is None:
+            # Strings have no numeric column, so there is nothing to plot
+            return np.empty(0), np.empty(0)
+        timestamps = self.timestamps
             
-            # Apply time range filter
-            if time_range:
-                if timestamp < time_range[0] or timestamp > time_range[1]:
-                    continue
+        # Apply downsampling
+        if downsample_factor > 1:
+            timestamps = timestamps[::downsample_factor]
+            values = values[::downsample_factor]
             
-            timestamps.append(timestamp)
-            value = frame['values'][dataref_index]
+        # Apply time range filter
+        if time_range:
+            mask = (timestamps >= time_range[0]) & (timestamps <= time_range[1])
+            timestamps = timestamps[mask]
+            values = values[mask]
             
-            if dr['array_size'] > 0:
-                values.append(value[array_index])
-            else:
-                if dr['type'] == 'string':
-                    values.append(0)  # Can't plot strings
-                else:
-                    values.append(value)
-                    
         return timestamps, values
         
     def get_parameter_statistics(self, dataref_index: int, array_index: int = 0,
                                  time_range: Optional[tuple] = None) -> Dict:
         """Calculate statistics for a parameter"""
-        timestamps, values = self.get_parameter_data(
+        _, values = self._get_parameter_arrays(
             dataref_index, array_index, time_range, downsample_factor=1
         )
         
-        if not values:
+        count = len(values)
+        if not count:
             return {}
         
-        values_array = np.array(values)
+        # Private float64 copy, so the median can partition it in place
+        values_array = values.astype(np.float64)
+        minimum = float(values_array.min())
+        maximum = float(values_array.max())
+        mean = float(values_array.sum()) / count
+        
+        # Sum of squared deviations rather than sum of squares, which cancels badly
+        deviations = values_array - mean
+        std = float(np.sqrt(np.dot(deviations, deviations) / count))
+        
+        middle = count // 2
+        if np.isnan(minimum):
+            median = minimum  # NaN propagates, as with np.median
+        elif count % 2:
+            values_array.partition(middle)
+            median = float(values_array[middle])
+        else:
+            values_array.partition((middle - 1, middle))
+            median = float(values_array[middle - 1] + values_array[middle]) / 2
         
         return {
-            'count': len(values),
-            'min': float(np.min(values_array)),
-            'max': float(np.max(values_array)),
-            'mean': float(np.mean(values_array)),
-            'median': float(np.median(values_array)),
-            'std': float(np.std(values_array)),
-            'range': float(np.max(values_array) - np.min(values_array))
+            'count': count,
+            'min': minimum,
+            'max': maximum,
+            'mean': mean,
+            'median': median,
+            'std': std,
+            'range': maximum - minimum
         }
         
     def get_all_plottable_parameters(self) -> List[Dict]:
@@ -413,21 +592,17 @@ class XDRData:
         Returns:
             tuple[List[float], List[float]]: (timestamps, derivative_values)
         """
-        timestamps, values = self.get_parameter_data(
+        timestamps, values = self._get_parameter_arrays(
             dataref_index, array_index, time_range, downsample_factor=1
         )
         
         if len(timestamps) < 2:
             return [], []
         
-        # Calculate derivative using numpy
-        values_array = np.array(values)
-        timestamps_array = np.array(timestamps)
-        
         # Use gradient for better numerical derivative
-        derivative = np.gradient(values_array, timestamps_array)
+        derivative = np.gradient(values.astype(np.float64), timestamps)
         
-        return timestamps, derivative.tolist()
+        return timestamps.tolist(), derivative.tolist()
     
     def get_parameter_fft(self, dataref_index: int, array_index: int = 0,
                           time_range: Optional[tuple] = None) -> tuple:
@@ -436,7 +611,7 @@ class XDRData:
         Returns:
             tuple[List[float], List[float]]: (frequencies, magnitudes)
         """
-        timestamps, values = self.get_parameter_data(
+        timestamps, values = self._get_parameter_arrays(
             dataref_index, array_index, time_range, downsample_factor=1
         )
         
@@ -444,7 +619,7 @@ class XDRData:
             return [], []
         
         # Calculate FFT
-        values_array = np.array(values)
+        values_array = values.astype(np.float64)
         n = len(values_array)
         
         # Remove mean (DC component)
@@ -458,8 +633,7 @@ class XDRData:
         fft = np.fft.rfft(values_windowed)
         
         # Calculate frequencies
-        timestamps_array = np.array(timestamps)
-        sample_rate = 1.0 / np.mean(np.diff(timestamps_array))
+        sample_rate = 1.0 / np.mean(np.diff(timestamps))
         frequencies = np.fft.rfftfreq(n, d=1.0/sample_rate)
         
         # Calculate magnitude
@@ -472,8 +646,8 @@ class XDRData:
                              param2_index: int, param2_array_idx: int,
                              time_range: Optional[tuple] = None) -> float:
         """Calculate correlation coefficient between two parameters"""
-        _, values1 = self.get_parameter_data(param1_index, param1_array_idx, time_range, 1)
-        _, values2 = self.get_parameter_data(param2_index, param2_array_idx, time_range, 1)
+        _, values1 = self._get_parameter_arrays(param1_index, param1_array_idx, time_range, 1)
+        _, values2 = self._get_parameter_arrays(param2_index, param2_array_idx, time_range, 1)
         
         if len(values1) != len(values2) or len(values1) < 2:
             return 0.0
@@ -494,14 +668,17 @@ class XDRData:
             writer = csv.writer(csvfile)
             writer.writerow(header_row)
             
-            for frame in self.frames:
-                row = [frame['timestamp']]
-                for value in frame['values']:
-                    if isinstance(value, list):
-                        row.extend(value)
-                    else:
-                        row.append(value)
-                writer.writerow(row)
+            # Build the rows from the columns, in dataref order
+            columns = [self.timestamps.tolist()]
+            for i, dr in enumerate(self.datarefs):
+                if dr['type'] == 'string':
+                    # String arrays are not recorded, so they add no values
+                    if dr['array_size'] == 0:
+                        columns.append(self.string_columns[i])
+                else:
+                    columns.extend(self.columns[(i, j)].tolist()
+                                   for j in range(max(dr['array_size'], 1)))
+            writer.writerows(zip(*columns))
 
 
 class PlotCanvas(FigureCanvas):
@@ -552,14 +729,20 @@ class PlotCanvas(FigureCanvas):
         total_frames = len(data.frames)
         downsample_factor = max(1, total_frames // self.MAX_PLOT_POINTS)
         
-        theme = get_current_theme()
+        # Look the theme colors up once instead of once per axis and spine
+        colors = get_current_theme().colors
+        surface = colors['surface']
+        text_primary = colors['text_primary']
+        text_secondary = colors['text_secondary']
+        border = colors['border']
+        grid_color = colors['border_hover']
         
         if separate_axes:
             # Each parameter on its own axis
             n = len(parameters)
             for i, param in enumerate(parameters):
                 ax = self.fig.add_subplot(n, 1, i + 1)
-                ax.set_facecolor(theme.colors['surface'])
+                ax.set_facecolor(surface)
                 self.axes.append(ax)
                 
                 if plot_derivative:
@@ -579,22 +762,20 @@ class PlotCanvas(FigureCanvas):
                 line, = ax.plot(timestamps, values, color=color, linewidth=1.5, antialiased=True)
                 self.plots.append(line)
                 
-                ax.set_ylabel(ylabel, fontsize=9, color=theme.colors['text_primary'], fontweight='500')
-                ax.tick_params(colors=theme.colors['text_secondary'], labelsize=8)
-                ax.spines['bottom'].set_color(theme.colors['border'])
-                ax.spines['top'].set_color(theme.colors['border'])
-                ax.spines['left'].set_color(theme.colors['border'])
-                ax.spines['right'].set_color(theme.colors['border'])
+                ax.set_ylabel(ylabel, fontsize=9, color=text_primary, fontweight='500')
+                ax.tick_params(colors=text_secondary, labelsize=8)
+                for spine in ax.spines.values():
+                    spine.set_color(border)
                 if show_grid:
-                    ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5, color=theme.colors['border_hover'])
+                    ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5, color=grid_color)
                 
                 if i == len(parameters) - 1:
-                    ax.set_xlabel('Time (seconds)', color=theme.colors['text_primary'], fontsize=9, fontweight='500')
+                    ax.set_xlabel('Time (seconds)', color=text_primary, fontsize=9, fontweight='500')
                     
         else:
             # All parameters on same axis
             ax = self.fig.add_subplot(111)
-            ax.set_facecolor(theme.colors['surface'])
+            ax.set_facecolor(surface)
             self.axes.append(ax)
             
             for i, param in enumerate(parameters):
@@ -616,18 +797,16 @@ class PlotCanvas(FigureCanvas):
                                label=label, antialiased=True)
                 self.plots.append(line)
                 
-            ax.set_xlabel('Time (seconds)', color=theme.colors['text_primary'], fontsize=9, fontweight='500')
+            ax.set_xlabel('Time (seconds)', color=text_primary, fontsize=9, fontweight='500')
             ylabel = 'Rate of Change' if plot_derivative else 'Value'
-            ax.set_ylabel(ylabel, color=theme.colors['text_primary'], fontsize=9, fontweight='500')
-            ax.tick_params(colors=theme.colors['text_secondary'], labelsize=8)
-            ax.spines['bottom'].set_color(theme.colors['border'])
-            ax.spines['top'].set_color(theme.colors['border'])
-            ax.spines['left'].set_color(theme.colors['border'])
-            ax.spines['right'].set_color(theme.colors['border'])
+            ax.set_ylabel(ylabel, color=text_primary, fontsize=9, fontweight='500')
+            ax.tick_params(colors=text_secondary, labelsize=8)
+            for spine in ax.spines.values():
+                spine.set_color(border)
             if show_grid:
-                ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5, color=theme.colors['border_hover'])
-            ax.legend(loc='upper right', fontsize=8, facecolor=theme.colors['surface_alt'], 
-                     edgecolor=theme.colors['primary'], labelcolor=theme.colors['text_primary'], framealpha=0.95)
+                ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5, color=grid_color)
+            ax.legend(loc='upper right', fontsize=8, facecolor=colors['surface_alt'], 
+                     edgecolor=colors['primary'], labelcolor=text_primary, framealpha=0.95)
             
         self.fig.tight_layout()
         self.draw()
@@ -1422,14 +1601,9 @@ class FlightPath3DWidget(QWidget):
             return
         
         # Extract data
-        lats = []
-        lons = []
-        alts = []
-        
-        for frame in self.data.frames:
-            lats.append(frame['values'][lat_idx])
-            lons.append(frame['values'][lon_idx])
-            alts.append(frame['values'][alt_idx])
+        _, lats = self.data.get_parameter_data(lat_idx)
+        _, lons = self.data.get_parameter_data(lon_idx)
+        _, alts = self.data.get_parameter_data(alt_idx)
         
         if not lats:
             self.stats_label.setText("⚠️ No position data available")
@@ -1568,7 +1742,7 @@ class MainWindow(QMainWindow):
     def setup_ui(self):
         self.setWindowTitle(tr('window_title'))
         self.setMinimumSize(1200, 800)
-        self.setStyleSheet(self.get_stylesheet())
+        self.apply_theme_style()
         
         central = QWidget()
         self.setCentralWidget(central)
@@ -1824,8 +1998,7 @@ class MainWindow(QMainWindow):
         
         self.theme_actions = []
         for theme_key in get_theme_names():
-            theme = get_theme_by_name(theme_key)
-            action = QAction(theme.name, self)
+            action = QAction(get_theme_display_name(theme_key), self)
             action.setCheckable(True)
             action.triggered.connect(partial(self.change_theme, theme_key))
             theme_menu.addAction(action)
@@ -2309,15 +2482,21 @@ class MainWindow(QMainWindow):
         """Get application stylesheet from current theme"""
         return get_current_theme().get_stylesheet()
     
+    def apply_theme_style(self):
+        """Apply the current theme's stylesheet"""
+        self.setStyleSheet(self.get_stylesheet())
+    
     def change_theme(self, theme_name: str):
         """Change application theme"""
-        set_theme(theme_name)
-        self.setStyleSheet(self.get_stylesheet())
-        
-        # Update checkmarks in theme menu
+        # Update checkmarks in theme menu (re-selecting the active theme unchecks it)
         for key, action in self.theme_actions:
             action.setChecked(key == theme_name)
         
+        # Nothing to restyle or redraw when the theme is already active
+        if not set_theme(theme_name):
+            return
+        self.apply_theme_style()
+        
         # Redraw plots with new theme colors
         self.param_selector.assigned_colors = {}
         self.param_selector.next_color_index = 0